@@ -2,7 +2,7 @@ from fastapi import APIRouter, HTTPException, Query, BackgroundTasks, Request
 from fastapi.concurrency import run_in_threadpool
 from typing import List, Dict, Any, Optional
 from app.services.hubspot_service import HubspotService
-from app.services.gong_service import GongService
+from app.services.gong_service import GongService, LRUCache
 from app.services.session_service import SessionService
 from app.services.firecrawl_service import get_company_analysis
 from app.utils.general_utils import extract_company_name
@@ -51,6 +51,13 @@ deal_info_repo = DealInfoRepository()
 # Store ongoing requests by browser ID
 ongoing_requests = {}
 
+# /contacts-and-champion responses keyed by "{deal_name}_{date}". get_champions keeps its own
+# per-company results in gong_service.champion_cache, keyed by ("champions", company, date)
+champion_response_cache = LRUCache(capacity=1000, ttl=3600)
+# browser_id -> {(deal_name, date)} requested from /contacts-and-champion, so clear_all_cache
+# only drops that browser's champion entries; same TTL as the caches it points into
+champion_requests_by_browser = LRUCache(capacity=1000, ttl=3600)
+
 # In-memory cache for ultra-fast repeated requests (10 min TTL)
 _endpoint_cache = {}
 _CACHE_TTL = 600  # 10 minutes
@@ -471,7 +478,7 @@ def process_champion_request_sync(browser_id: str, deal_name: str, target_date:
         }
         
         print(Fore.BLUE + f"[CACHE] Writing result to Champion cache: {cache_key}" + Style.RESET_ALL)
-        gong_service.champion_cache.put(cache_key, result)
+        champion_response_cache.put(cache_key, result)
         print(Fore.BLUE + f"Successfully processed champion request for {deal_name}" + Style.RESET_ALL)
         return result  # Return the result directly
     except Exception as e:
@@ -495,12 +502,19 @@ async def get_contacts_and_champion(
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid date format. Please use YYYY-MM-DD format.")
 
+        # Remember which deals this browser asked about, for clear_all_cache
+        browser_id = request.headers.get("X-Browser-ID")
+        if browser_id:
+            requested = champion_requests_by_browser.get(browser_id) or set()
+            requested.add((dealName, target_date.strftime('%Y-%m-%d')))
+            champion_requests_by_browser.put(browser_id, requested)
+
         # Create composite cache key
         cache_key = f"{dealName}_{date}"
         print(Fore.BLUE + f"Processing request for deal: {dealName}" + Style.RESET_ALL)
 
         # First check if we have the result in cache
-        cached_result = gong_service.champion_cache.get(cache_key)
+        cached_result = champion_response_cache.get(cache_key)
         
         if cached_result:
             print(Fore.BLUE + f"[CACHE] Reading from Champion cache: {cache_key}" + Style.RESET_ALL)
@@ -667,7 +681,7 @@ async def clear_all_cache(
     browser_id: str,
     request: Request
 ):
-    """Delete all cache entries associated with a browser ID and clear the champion data cache"""
+    """Delete all cache entries associated with a browser ID and the champion data it requested"""
     try:
         print(Fore.BLUE + f"[CACHE] Clearing all caches for browser: {browser_id}" + Style.RESET_ALL)
         
@@ -682,13 +696,18 @@ async def clear_all_cache(
             del ongoing_requests[key]
             print(Fore.MAGENTA + f"[CACHE] Removed ongoing request entry: {key}" + Style.RESET_ALL)
         
-        # 2. Clear champion data cache entries for this browser
-        gong_service = GongService()
-        champion_cache_keys = gong_service.champion_cache.keys()
-        champion_keys_to_remove = [key for key in champion_cache_keys if key.startswith(f"{browser_id}_")]
-        for key in champion_keys_to_remove:
-            gong_service.champion_cache.remove(key)
-            print(Fore.MAGENTA + f"[CACHE] Removed champion cache entry: {key}" + Style.RESET_ALL)
+        # 2. Clear the champion entries for the deals this browser requested. Neither cache is keyed
+        # by browser_id (endpoint responses use "{deal_name}_{date}", get_champions uses
+        # ("champions", company, date)), so the keys come from champion_requests_by_browser.
+        requested = champion_requests_by_browser.get(browser_id) or set()
+        champion_requests_by_browser.remove(browser_id)
+        champion_keys_to_remove = []
+        for deal_name, date_str in requested:
+            company_key = ("champions", extract_company_name(deal_name).lower(), date_str)
+            for cache, key in ((champion_response_cache, f"{deal_name}_{date_str}"), (gong_service.champion_cache, company_key)):
+                cache.remove(key)
+                champion_keys_to_remove.append(key)
+                print(Fore.MAGENTA + f"[CACHE] Removed champion cache entry: {key}" + Style.RESET_ALL)
         
         return {
             "message": f"Successfully cleared all caches for browser {browser_id}",
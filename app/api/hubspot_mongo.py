@@ -18,6 +18,7 @@ import threading
 import queue
 from pydantic import BaseModel
 from app.services.llm_service import ask_openai
+from app.utils.general_utils import extract_company_name
 from collections import defaultdict
 import time
 
@@ -1472,6 +1473,11 @@ async def get_sync_status(job_id: str):
             "cancelled": job.get("cancelled", False),
             "type": job.get("type", "unknown")  # Add type to response for debugging
         }
+
+        # Jobs that queue a background owner-performance sync report it separately
+        if "owner_performance_status" in job:
+            response["owner_performance_status"] = job["owner_performance_status"]
+            response["owner_performance_error"] = job.get("owner_performance_error")
         
         # Add job-specific fields based on job type
         if job.get("type") == "force_meeting_insights":
@@ -1632,13 +1638,14 @@ def run_force_meeting_insights_job(job_id: str, deal_names: List[str], epoch0: s
             
             # First delete all existing meeting insights for this deal
             delete_result = meeting_insights_repo.delete_many({"deal_id": deal_name})
+            company_name = extract_company_name(deal_name)
             
             current_date = start_date
             while current_date <= end_date:
                 current_date_str = current_date.strftime("%Y-%m-%d")
                 try:
                     # Use existing sync_meeting_insights method but with force update
-                    sync_service._sync_meeting_insights(deal_name, current_date_str, force_update=True)
+                    sync_service._sync_meeting_insights(deal_name, current_date_str, company_name, force_update=True)
                 except Exception as e:
                     pass  # Error syncing, continue
                 current_date += timedelta(days=1)
@@ -2244,14 +2251,32 @@ async def sync_all_stages_on_date(
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=f"Error starting sync job: {str(e)}")
 
+def _record_owner_performance_status(job_id: str, future) -> None:
+    """Done-callback for a job's background owner-performance sync"""
+    if future.cancelled():
+        sync_jobs[job_id]["owner_performance_status"] = "cancelled"
+    elif future.exception() is not None:
+        sync_jobs[job_id]["owner_performance_status"] = "failed"
+        sync_jobs[job_id]["owner_performance_error"] = str(future.exception())
+    else:
+        sync_jobs[job_id]["owner_performance_status"] = "completed"
+
 def run_sync_all_stages_on_date(job_id: str, date_str: str):
     """Background function to run sync_all_stages_on_date"""
     try:
         sync_service_v2 = DataSyncService2()
-        sync_service_v2.sync_all_stages_on_date(date_str)
+        owner_performance_future = sync_service_v2.sync_all_stages_on_date(date_str)
         
+        # The deal sync is done; owner performance keeps running in the background, so report it separately
         sync_jobs[job_id]["status"] = "completed"
         sync_jobs[job_id]["message"] = f"Successfully synced all stages for date: {date_str}"
+        if owner_performance_future is None:
+            sync_jobs[job_id]["owner_performance_status"] = "skipped"
+        else:
+            sync_jobs[job_id]["owner_performance_status"] = "running"
+            owner_performance_future.add_done_callback(
+                lambda future: _record_owner_performance_status(job_id, future)
+            )
     except Exception as e:
         sync_jobs[job_id]["status"] = "failed"
         sync_jobs[job_id]["message"] = f"Error syncing data: {str(e)}"
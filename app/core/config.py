@@ -27,6 +27,14 @@ class Settings(BaseSettings):
     CHUNK_SIZE: int = 600
     TOP_K_CHUNKS: int = 10
 
+    # Longest transcript (in characters) sent to an LLM prompt; longer ones keep head + tail
+    GONG_TRANSCRIPT_MAX_CHARS: int = 24000
+    # Concurrent champion/PARR LLM requests per get_champions call
+    GONG_LLM_CONCURRENCY: int = 8
+
+    # Logging Configuration
+    LOG_LEVEL: str = "INFO"
+
     # MongoDB Configuration via env vars
     MONGO_USER: str
     MONGO_PASS: str
@@ -0,0 +1,51 @@
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+from colorama import Fore, Style
+from app.core.config import settings
+
+_LEVEL_COLORS = {
+    logging.DEBUG: Fore.LIGHTBLACK_EX,
+    logging.INFO: "",
+    logging.WARNING: Fore.YELLOW,
+    logging.ERROR: Fore.RED,
+    logging.CRITICAL: Fore.RED,
+}
+
+class ColorFormatter(logging.Formatter):
+    """Formatter that adds ANSI colors per level, only when writing to a TTY"""
+
+    def __init__(self, fmt: str, stream=None):
+        super().__init__(fmt)
+        stream = stream or sys.stderr
+        self.use_color = hasattr(stream, "isatty") and stream.isatty()
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        color = _LEVEL_COLORS.get(record.levelno, "")
+        if self.use_color and color:
+            return color + message + Style.RESET_ALL
+        return message
+
+def configure_logging(level: str = None) -> None:
+    """Attach a single stderr handler to the "app" logger (idempotent).
+
+    Records are handed to a background QueueListener, so sync worker threads
+    never block on formatting or writing to stderr."""
+    app_logger = logging.getLogger("app")
+    app_logger.setLevel((level or settings.LOG_LEVEL).upper())
+    if app_logger.handlers:
+        return
+
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(ColorFormatter("%(asctime)s %(levelname)s [%(name)s] %(message)s", sys.stderr))
+
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    app_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    app_logger.propagate = False
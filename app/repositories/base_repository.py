@@ -1,14 +1,24 @@
 from typing import Dict, List, Optional, Any
+import logging
+from pymongo.errors import OperationFailure
 from app.db.mongo_client import MongoConnection
 
+logger = logging.getLogger(__name__)
+
 class BaseRepository:
     def __init__(self, collection_name: str):
         self.db = MongoConnection.get_db()
         self.collection = self.db[collection_name]
 
     def create_index(self, keys, **kwargs):
-        """Create an index on the collection"""
-        return self.collection.create_index(keys, **kwargs)
+        """Create an index on the collection.
+        Conflicts with an existing index (or duplicate keys for a unique index)
+        are reported and ignored so repository init stays idempotent."""
+        try:
+            return self.collection.create_index(keys, **kwargs)
+        except OperationFailure as e:
+            logger.warning("Could not create index %s on %s: %s", keys, self.collection.name, e)
+            return None
 
     def find_one(self, filter_dict: Dict) -> Optional[Dict]:
         """Find a single document"""
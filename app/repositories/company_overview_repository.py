@@ -1,9 +1,14 @@
 from app.repositories.base_repository import BaseRepository
 from pymongo import UpdateOne
+from datetime import datetime
 
 class CompanyOverviewRepository(BaseRepository):
     def __init__(self):
         super().__init__("company_overview")
+        self._create_indexes()
+
+    def _create_indexes(self):
+        self.create_index({"deal_id": 1}, unique=True)
         
     def get_by_deal_id(self, deal_id: str) -> dict:
         """Get company overview by deal ID"""
@@ -12,6 +17,6 @@ class CompanyOverviewRepository(BaseRepository):
     def upsert_by_deal_id(self, deal_id: str, overview: str) -> bool:
         """Upsert company overview by deal ID"""
         filter_dict = {"deal_id": deal_id}
-        update_dict = {"$set": {"deal_id": deal_id, "overview": overview}}
+        update_dict = {"$set": {"deal_id": deal_id, "overview": overview, "last_updated": datetime.utcnow()}}
         result = self.collection.update_one(filter_dict, update_dict, upsert=True)
         return result.modified_count > 0 or result.upserted_id is not None
\ No newline at end of file
@@ -15,6 +15,10 @@ class DealInfoRepository(BaseRepository):
     def get_by_deal_id(self, deal_id: str) -> Optional[Dict]:
         return self.find_one({"deal_id": deal_id})
 
+    def get_content_hash(self, deal_id: str) -> Optional[str]:
+        doc = self.collection.find_one({"deal_id": deal_id}, {"content_hash": 1})
+        return doc.get("content_hash") if doc else None
+
     def get_by_company_name(self, company_name: str) -> List[Dict]:
         return self.find_many({"company_name": company_name})
 
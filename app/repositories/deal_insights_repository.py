@@ -1,6 +1,7 @@
 from typing import Dict, Optional, List
 from datetime import datetime
 from app.repositories.base_repository import BaseRepository
+from app.utils.general_utils import content_hash
 
 class DealInsightsRepository(BaseRepository):
     def __init__(self):
@@ -24,42 +25,51 @@ class DealInsightsRepository(BaseRepository):
         )
         return result.modified_count > 0 or result.upserted_id is not None
 
-    def upsert_activity_with_concerns_list(self, deal_id: str, activity_data: Dict, new_concerns: Dict) -> bool:
+    def upsert_activity_with_concerns_list(self, deal_id: str, activity_data: Dict, new_concerns: Dict,
+                                           concern_date: Optional[str] = None) -> bool:
         """
         Upsert activity data and handle concerns as a list.
         If concerns already exist as a dictionary, convert to list of size 1.
         If concerns already exist as a list, append new concerns.
+        A concern is appended once per (concern_date, content hash), tracked in the
+        parallel concern_keys array, so re-syncing a day doesn't grow the list while
+        identical concerns from different days are all kept.
+
+        The append happens server-side, so concurrent syncs of the same deal
+        (e.g. different days in parallel) don't overwrite each other's concerns.
         """
-        # Get existing document to check current concerns structure
-        existing_doc = self.find_one({"deal_id": deal_id})
-        
-        # Prepare concerns list
-        if existing_doc and "concerns" in existing_doc:
-            existing_concerns = existing_doc["concerns"]
-            if isinstance(existing_concerns, dict):
-                # Convert existing dictionary to list with one item
-                concerns_list = [existing_concerns]
-            elif isinstance(existing_concerns, list):
-                # Use existing list
-                concerns_list = existing_concerns
-            else:
-                # Invalid format, start fresh
-                concerns_list = []
-        else:
-            # No existing concerns, start fresh
-            concerns_list = []
-        
-        # Add new concerns to the list
-        concerns_list.append(new_concerns)
-        
-        # Update activity_data with the concerns list
-        activity_data["concerns"] = concerns_list
+        # Older documents stored concerns as a single dict (or an invalid value);
+        # normalize those to a list so new concerns can be appended to it
+        self.collection.update_one(
+            {"deal_id": deal_id, "concerns": {"$exists": True, "$not": {"$type": "array"}}},
+            [{"$set": {"concerns": {
+                "$cond": [{"$eq": [{"$type": "$concerns"}, "object"]}, ["$concerns"], []]
+            }}}]
+        )
+
+        activity_data.pop("concerns", None)
         activity_data["deal_id"] = deal_id
         activity_data["last_updated"] = datetime.utcnow()
-        
+
+        # content_hash sorts keys, so the same concern hashes the same regardless of key order
+        concern_key = f"{concern_date}:{content_hash(new_concerns)}"
+        already_stored = {"$in": [concern_key, {"$ifNull": ["$concern_keys", []]}]}
         result = self.collection.update_one(
             {"deal_id": deal_id},
-            {"$set": activity_data},
+            [{"$set": {
+                # $literal keeps "$"-prefixed strings in the data from being read as field paths
+                **{key: {"$literal": value} for key, value in activity_data.items()},
+                "concerns": {"$cond": [
+                    already_stored,
+                    "$concerns",
+                    {"$concatArrays": [{"$ifNull": ["$concerns", []]}, [{"$literal": new_concerns}]]}
+                ]},
+                "concern_keys": {"$cond": [
+                    already_stored,
+                    "$concern_keys",
+                    {"$concatArrays": [{"$ifNull": ["$concern_keys", []]}, [concern_key]]}
+                ]}
+            }}],
             upsert=True
         )
         return result.modified_count > 0 or result.upserted_id is not None
@@ -1,3 +1,5 @@
+from typing import Dict, List, Tuple
+from pymongo import ReplaceOne
 from app.repositories.base_repository import BaseRepository
 
 class DealOwnerPerformanceRepository(BaseRepository):
@@ -20,3 +22,17 @@ class DealOwnerPerformanceRepository(BaseRepository):
             "owner": owner,
             "deals_performance": performance
         })
+
+    def bulk_replace(self, records: List[Tuple[str, Dict]]) -> None:
+        """Replace (or create) the performance document of every owner in one round-trip"""
+        if not records:
+            return
+        operations = [
+            ReplaceOne(
+                {"owner": owner},
+                {"owner": owner, "deals_performance": performance},
+                upsert=True
+            )
+            for owner, performance in records
+        ]
+        self.collection.bulk_write(operations, ordered=False)
@@ -1,5 +1,6 @@
 from typing import Dict, List, Optional
 from datetime import datetime
+from pymongo.errors import DuplicateKeyError
 from app.repositories.base_repository import BaseRepository
 
 class DealTimelineRepository(BaseRepository):
@@ -25,7 +26,36 @@ class DealTimelineRepository(BaseRepository):
 
     def get_by_deal_id(self, deal_id: str) -> Optional[Dict]:
         return self.find_one({"deal_id": deal_id})
-    
+
+    def get_meeting_intent_dates(self, deal_ids: List[str], intents: List[str]) -> Dict[str, Dict[str, List]]:
+        """
+        Group Meeting event dates by deal and lowercased buyer_intent, server-side.
+        Only events whose buyer_intent is one of `intents` are returned.
+        Returns {deal_id: {buyer_intent: [event_date, ...]}}
+        """
+        if not deal_ids:
+            return {}
+        pipeline = [
+            {"$match": {"deal_id": {"$in": list(set(deal_ids))}, "events.event_type": "Meeting"}},
+            {"$unwind": "$events"},
+            {"$match": {"events.event_type": "Meeting", "events.buyer_intent": {"$type": "string"}}},
+            {"$project": {
+                "deal_id": 1,
+                "event_date": "$events.event_date",
+                "buyer_intent": {"$toLower": "$events.buyer_intent"}
+            }},
+            {"$match": {"buyer_intent": {"$in": intents}}},
+            {"$group": {
+                "_id": {"deal_id": "$deal_id", "buyer_intent": "$buyer_intent"},
+                "event_dates": {"$push": "$event_date"}
+            }}
+        ]
+        result = {}
+        for row in self.collection.aggregate(pipeline):
+            key = row["_id"]
+            result.setdefault(key["deal_id"], {})[key["buyer_intent"]] = row["event_dates"]
+        return result
+
     def get_meetings_in_date_range(self, start_date: datetime, end_date: datetime) -> List[Dict]:
         """
         Get all meetings within a date range using MongoDB aggregation for optimal performance
@@ -428,26 +458,30 @@ class DealTimelineRepository(BaseRepository):
         
         return list(self.collection.aggregate(pipeline))
 
+    @staticmethod
+    def _transform_event(event: Dict) -> Dict:
+        """Convert a HubSpot/Gong timeline event into the stored event format"""
+        event_date = datetime.strptime(
+            f"{event['date_str']} {event['time_str']}", 
+            "%Y-%m-%d %H:%M"
+        )
+        return {
+            "event_id": event['id'],
+            "event_type": event['type'],
+            "event_date": event_date,
+            "subject": event['subject'],
+            "content": event['content'] or event['content_preview'],
+            "sentiment": event['sentiment'],
+            "buyer_intent": event['buyer_intent'],
+            "buyer_intent_explanation": event.get('buyer_intent_explanation', "N/A"),
+            "engagement_id": event['engagement_id']
+        }
+
     def upsert_timeline(self, deal_id: str, timeline_data: Dict) -> bool:
 
         transformed_events = []
         for event in timeline_data.get('events', []):
-            event_date = datetime.strptime(
-                f"{event['date_str']} {event['time_str']}", 
-                "%Y-%m-%d %H:%M"
-            )
-            
-            transformed_event = {
-                "event_id": event['id'],
-                "event_type": event['type'],
-                "event_date": event_date,
-                "subject": event['subject'],
-                "content": event['content'] or event['content_preview'],
-                "sentiment": event['sentiment'],
-                "buyer_intent": event['buyer_intent'],
-                "buyer_intent_explanation": event.get('buyer_intent_explanation', "N/A"),
-                "engagement_id": event['engagement_id']
-            }
+            transformed_event = self._transform_event(event)
             print(f"🔍 DEBUG REPO: Transformed event buyer_intent_explanation type: {type(transformed_event['buyer_intent_explanation'])}")
             if isinstance(transformed_event['buyer_intent_explanation'], dict):
                 print(f"🔍 DEBUG REPO: Transformed event buyer_intent_explanation keys: {list(transformed_event['buyer_intent_explanation'].keys())}")
@@ -484,21 +518,7 @@ class DealTimelineRepository(BaseRepository):
         Returns:
             bool: True if successful, False otherwise
         """
-        event_date = datetime.strptime(
-            f"{event['date_str']} {event['time_str']}", 
-            "%Y-%m-%d %H:%M"
-        )
-        transformed_event = {
-            "event_id": event['id'],
-            "event_type": event['type'],
-            "event_date": event_date,
-            "subject": event['subject'],
-            "content": event['content'] or event['content_preview'],
-            "sentiment": event['sentiment'],
-            "buyer_intent": event['buyer_intent'],
-            "buyer_intent_explanation": event.get('buyer_intent_explanation', "N/A"),
-            "engagement_id": event['engagement_id']
-        }
+        transformed_event = self._transform_event(event)
 
         return self.update_one(
             {"deal_id": deal_id},
@@ -523,4 +543,60 @@ class DealTimelineRepository(BaseRepository):
                 "$pull": {"events": event},
                 "$set": {"last_updated": datetime.utcnow()}
             }
-        )
\ No newline at end of file
+        )
+
+    def bulk_replace_events(self, deal_id: str, new_events: List[Dict], upsert: bool = False) -> Optional[bool]:
+        """
+        Replace timeline events by subject in a single round-trip.
+        Existing events whose (trimmed, lowercased) subject matches one of the
+        new events are dropped, and the new events are appended.
+        Args:
+            deal_id: The deal ID
+            new_events: Event dictionaries matching HubSpot event structure
+            upsert: Create the timeline if the deal has none yet. This is atomic, so
+                concurrent writers for the same deal all keep their events.
+        Returns:
+            bool: True if the timeline was modified, False if it was left unchanged,
+            None if no timeline document exists for the deal (and upsert is False)
+        """
+        subjects_to_replace = list({
+            event["subject"].strip().lower() for event in new_events if event.get("subject")
+        })
+        transformed_events = [self._transform_event(event) for event in new_events]
+
+        pipeline = [
+            {
+                "$set": {
+                    "events": {
+                        "$concatArrays": [
+                            {
+                                "$filter": {
+                                    "input": {"$ifNull": ["$events", []]},
+                                    "cond": {
+                                        "$not": [{
+                                            "$in": [
+                                                {"$toLower": {"$trim": {"input": {"$ifNull": ["$$this.subject", ""]}}}},
+                                                {"$literal": subjects_to_replace}
+                                            ]
+                                        }]
+                                    }
+                                }
+                            },
+                            # $literal keeps "$"-prefixed strings in event content from being read as field paths
+                            {"$literal": transformed_events}
+                        ]
+                    },
+                    "last_updated": datetime.utcnow()
+                }
+            }
+        ]
+        try:
+            result = self.collection.update_one({"deal_id": deal_id}, pipeline, upsert=upsert)
+        except DuplicateKeyError:
+            # Another writer created the timeline first; now there is a document to update
+            result = self.collection.update_one({"deal_id": deal_id}, pipeline)
+        if result.upserted_id is not None:
+            return True
+        if result.matched_count == 0:
+            return None
+        return result.modified_count > 0
@@ -2,6 +2,9 @@ import os
 import sys
 import asyncio
 import json
+import concurrent.futures
+import functools
+import threading
 
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
@@ -12,13 +15,31 @@ from app.repositories.deal_insights_repository import DealInsightsRepository
 from app.repositories.deal_timeline_repository import DealTimelineRepository
 from app.repositories.meeting_insights_repository import MeetingInsightsRepository
 from app.repositories.company_overview_repository import CompanyOverviewRepository
-from app.utils.general_utils import extract_company_name
+from app.utils.general_utils import extract_company_name, parse_iso_date, content_hash, date_range_strs
 from app.services.hubspot_service import HubspotService
-from app.services.firecrawl_service import get_company_analysis
+from app.services.firecrawl_service import get_company_analysis, get_company_analyses, is_failed_analysis
 from app.core.config import settings
-from colorama import Fore, Style, init
+import logging
 
-init()
+logger = logging.getLogger(__name__)
+
+# Company overviews come from Firecrawl and rarely change; skip refreshing them
+# if the stored copy is newer than this.
+COMPANY_OVERVIEW_TTL = timedelta(days=7)
+
+# Max number of days whose Gong concerns are analyzed in parallel per deal
+CONCERNS_MAX_WORKERS = 5
+
+def _sync_run(method):
+    """Run method inside a sync run, so it shares the per-run caches of any run already in progress"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._enter_run()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._exit_run()
+    return wrapper
 
 class DataSyncService:
     def __init__(self):
@@ -29,7 +50,49 @@ class DataSyncService:
         self.deal_timeline_repo = DealTimelineRepository()
         self.meeting_insights_repo = MeetingInsightsRepository()
         self.company_overview_repo = CompanyOverviewRepository()
+        # Per-run caches; they live only while a public entry point (see _sync_run) is running,
+        # so a long-lived instance never serves a stale Gong call list
+        self._run_lock = threading.Lock()
+        self._active_runs = 0
+        self._reset_run_caches()
+
+    def _reset_run_caches(self) -> None:
+        # company_name -> overview, so each company hits Firecrawl at most once per run
+        self._overview_cache = {}
+        # date_str -> Gong calls, and (date_str, company_name) -> call_id, shared by
+        # the insights and meeting passes so each lookup happens once per run
+        self._calls_by_date = {}
+        self._call_ids = {}
+
+    def _enter_run(self) -> None:
+        with self._run_lock:
+            if self._active_runs == 0:
+                self._reset_run_caches()
+            self._active_runs += 1
+
+    def _exit_run(self) -> None:
+        with self._run_lock:
+            self._active_runs -= 1
+            if self._active_runs == 0:
+                self._reset_run_caches()
+
+    def _get_call_id(self, date_str: str, company_name: str) -> Optional[str]:
+        key = (date_str, company_name)
+        # Called from the _sync_deal_insights thread pool, so the dicts are only touched under
+        # the lock; the Gong lookup itself runs outside it
+        with self._run_lock:
+            if key in self._call_ids:
+                return self._call_ids[key]
+            calls = self._calls_by_date.get(date_str)
+        if calls is None:
+            calls = self.gong_service.list_calls(date_str)
+        call_id = self.gong_service.get_call_id(calls, company_name)
+        with self._run_lock:
+            self._calls_by_date.setdefault(date_str, calls)
+            self._call_ids[key] = call_id
+        return call_id
 
+    @_sync_run
     def sync(self, stage: str = "all", epoch0: int = 0) -> None:
         """
         Sync data for all deals within the specified date range.
@@ -41,16 +104,19 @@ class DataSyncService:
         end_date = datetime.now()
         start_date = end_date - timedelta(days=epoch0)
         
-        print(Fore.MAGENTA + f"Syncing data from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}" + Style.RESET_ALL)
+        logger.info("Syncing data from %s to %s", start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
 
         all_deals = self.hubspot_service.get_all_deals()
 
         if stage != "all":
-            all_deals = [
-                deal for deal in all_deals 
-                if deal.get("stage", "").lower() == stage.lower()
-            ]
-            print(Fore.MAGENTA + f"Filtered to the {len(all_deals)} deals in stage '{stage}'" + Style.RESET_ALL) 
+            all_deals = self.hubspot_service.get_deals_in_stage(stage)
+            logger.info("Filtered to the %d deals in stage '%s'", len(all_deals), stage)
+
+        # Shared by every deal in the loop below
+        date_strs = date_range_strs(start_date, end_date)
+        stale_overview_deals = self._prefetch_company_overviews(
+            [deal.get("dealname") for deal in all_deals if deal.get("dealname")]
+        )
 
         for deal in all_deals:
             try:
@@ -58,55 +124,61 @@ class DataSyncService:
                 if not deal_name:
                     continue
 
-                print(Fore.YELLOW + f"\n### Syncing Deal Info, Insights & Timeline: {deal_name} ###" + Style.RESET_ALL)
+                logger.info("### Syncing Deal Info, Insights & Timeline: %s ###", deal_name)
+                company_name = extract_company_name(deal_name)
+
                 # Sync company overview (this doesn't depend on date range)
-                self.sync_company_overviews(deal_name)
+                self.sync_company_overviews(deal_name, company_name, stale=deal_name in stale_overview_deals)
                 
                 # Sync global deal data for the date range
-                self.sync_global_deal_data(deal_name, start_date, end_date)
+                self.sync_global_deal_data(deal_name, start_date, end_date, company_name, date_strs)
 
                 # Sync meeting data for each day in the range
-                current_date = start_date
-                while current_date <= end_date:
-                    self._sync_meeting_insights(deal_name, current_date.strftime("%Y-%m-%d"))
-                    current_date += timedelta(days=1)
+                for date_str in date_strs:
+                    self._sync_meeting_insights(deal_name, date_str, company_name)
 
             except Exception as e:
-                print(Fore.RED + f"Error syncing deal data: {str(e)}" + Style.RESET_ALL)
+                logger.error("Error syncing deal data: %s", e)
                 continue
                 
         return
 
-    def sync_global_deal_data(self, deal_name: str, start_date: datetime, end_date: datetime) -> None:
+    @_sync_run
+    def sync_global_deal_data(self, deal_name: str, start_date: datetime, end_date: datetime, company_name: Optional[str] = None, date_strs: Optional[List[str]] = None) -> None:
         """
         Sync global deal data within the specified date range.
         Args:
             deal_name: Name of the deal to sync
             start_date: Start date for the sync period
             end_date: End date for the sync period
+            company_name: Company name already extracted from the deal name (optional)
+            date_strs: Precomputed YYYY-MM-DD strings for the date range (optional)
         """
 
 
         try:
-            self._sync_deal_info(deal_name)
-            self._sync_deal_insights(deal_name, start_date, end_date)
+            if company_name is None:
+                company_name = extract_company_name(deal_name)
+            if date_strs is None:
+                date_strs = date_range_strs(start_date, end_date)
+            self._sync_deal_info(deal_name, company_name)
+            self._sync_deal_insights(deal_name, date_strs, company_name)
             self._sync_timeline_events(deal_name, start_date, end_date)
             return
 
         except Exception as e:
-            print(Fore.RED + f"Unexpected error in sync_deal_data: {str(e)}" + Style.RESET_ALL)
+            logger.error("Unexpected error in sync_deal_data: %s", e)
             return
 
-    def _sync_deal_info(self, deal_name: str) -> None:
+    def _sync_deal_info(self, deal_name: str, company_name: str) -> None:
         try:
             hubspot_deal = self._get_hubspot_deal_info(deal_name)
             if not hubspot_deal:
-                print(Fore.RED + f"Could not find deal '{deal_name}' in HubSpot" + Style.RESET_ALL)
+                logger.error("Could not find deal '%s' in HubSpot", deal_name)
                 return
 
-            company_name = extract_company_name(deal_name)
             if company_name == "Unknown Company":
-                print(Fore.RED + f"Could not extract company name from deal name: {deal_name}" + Style.RESET_ALL)
+                logger.error("Could not extract company name from deal name: %s", deal_name)
                 return
 
             amount = hubspot_deal.get("amount", "N/A")
@@ -127,11 +199,19 @@ class DataSyncService:
                 "last_modified_date": datetime.now()
             }
 
-            print(Fore.BLUE + f"[MongoDB] Updating DealInfo for {deal_name}." + Style.RESET_ALL)
+            # Only write when one of the HubSpot-derived fields actually changed
+            deal_info["content_hash"] = content_hash(
+                {k: deal_info[k] for k in ("deal_id", "stage", "owner", "amount", "company_name", "created_date")}
+            )
+            if self.deal_info_repo.get_content_hash(deal_name) == deal_info["content_hash"]:
+                logger.debug("DealInfo for %s is unchanged, skipping update.", deal_name)
+                return
+
+            logger.info("[MongoDB] Updating DealInfo for %s.", deal_name)
             self.deal_info_repo.upsert_deal(deal_name, deal_info)
 
         except Exception as e:
-            print(Fore.RED + f"Error syncing deal info: {str(e)}" + Style.RESET_ALL)
+            logger.error("Error syncing deal info: %s", e)
 
     def _get_hubspot_deal_info(self, deal_name: str) -> Optional[Dict]:
         """
@@ -148,11 +228,11 @@ class DataSyncService:
             # Find matching deal
             for deal in all_deals:
                 if deal.get("dealname", "").lower().strip() == deal_name.lower().strip():
-                    print(Fore.GREEN + f"Found deal '{deal_name}' in HubSpot" + Style.RESET_ALL)
+                    logger.debug("Found deal '%s' in HubSpot", deal_name)
                     return deal
             return None
         except Exception as e:
-            print(Fore.RED + f"Error getting HubSpot deal info: {str(e)}" + Style.RESET_ALL)
+            logger.error("Error getting HubSpot deal info: %s", e)
             return None
 
     def _parse_date(self, date_str: Optional[str]) -> datetime:
@@ -168,33 +248,42 @@ class DataSyncService:
             
         try:
             # Try to parse HubSpot date format
-            return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+            return parse_iso_date(date_str)
         except (ValueError, TypeError):
             return datetime.now()
 
-    def _sync_deal_insights(self, deal_name: str, start_date: datetime, end_date: datetime) -> None:
-        company_name = extract_company_name(deal_name)
-        current_date = start_date
-
-        while current_date <= end_date:
-            current_date_str = current_date.strftime("%Y-%m-%d")
+    def _fetch_concerns_for_date(self, deal_name: str, date_str: str, company_name: str) -> Optional[Dict]:
+        # check if a call exists for this deal on this date
+        if not self._get_call_id(date_str, company_name):
+            return None
+        return self.gong_service.get_concerns(deal_name, date_str)
+
+    def _sync_deal_insights(self, deal_name: str, date_strs: List[str], company_name: str) -> None:
+        # Gong lookups and LLM calls for each day are independent, so fan them out
+        concerns_by_date = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=CONCERNS_MAX_WORKERS) as executor:
+            future_to_date = {
+                executor.submit(self._fetch_concerns_for_date, deal_name, date_str, company_name): date_str
+                for date_str in date_strs
+            }
+            for future in concurrent.futures.as_completed(future_to_date):
+                date_str = future_to_date[future]
+                try:
+                    concerns_by_date[date_str] = future.result()
+                except Exception as e:
+                    logger.error("Error getting concerns for deal %s on %s: %s", deal_name, date_str, e)
 
-            # check if a call exists for this deal on this date
-            calls = self.gong_service.list_calls(current_date_str)
-            call_id = self.gong_service.get_call_id(calls, company_name)
+        # Write in date order so the stored concerns list stays chronological
+        for current_date_str in date_strs:
+            new_concerns = concerns_by_date.get(current_date_str)
+            if new_concerns:
+                # Create base insights data without concerns
+                deal_insights_data = self._create_deal_insights_data(deal_name, [new_concerns])
+                # Remove concerns from the data since we'll handle it separately
+                deal_insights_data.pop("concerns", None)
 
-            if call_id:
-                new_concerns = self.gong_service.get_concerns(deal_name, current_date_str)
-                if new_concerns:
-                    # Create base insights data without concerns
-                    deal_insights_data = self._create_deal_insights_data(deal_name, [new_concerns])
-                    # Remove concerns from the data since we'll handle it separately
-                    deal_insights_data.pop("concerns", None)
-                    
-                    print(Fore.BLUE + f"[MongoDB] Updating DealInsights for {deal_name} with new concerns from {current_date_str}." + Style.RESET_ALL)
-                    self.deal_insights_repo.upsert_activity_with_concerns_list(deal_name, deal_insights_data, new_concerns)
-            
-            current_date += timedelta(days=1)
+                logger.debug("[MongoDB] Updating DealInsights for %s with new concerns from %s.", deal_name, current_date_str)
+                self.deal_insights_repo.upsert_activity_with_concerns_list(deal_name, deal_insights_data, new_concerns, current_date_str)
 
     def _create_deal_insights_data(self, deal_name: str, concerns_list: List[Dict]) -> Dict:
         # pricing_concerns should be 1 if any of the concerns have a pricing concern
@@ -230,11 +319,12 @@ class DataSyncService:
             "last_updated": datetime.now()
         }
 
-    def _sync_meeting_insights(self, deal_name: str, date_str: str, force_update: bool = False) -> None:
+    @_sync_run
+    def _sync_meeting_insights(self, deal_name: str, date_str: str, company_name: Optional[str] = None, force_update: bool = False) -> None:
         try:
-            calls = self.gong_service.list_calls(date_str)
-            company_name = extract_company_name(deal_name)
-            call_id = self.gong_service.get_call_id(calls, company_name)
+            if company_name is None:
+                company_name = extract_company_name(deal_name)
+            call_id = self._get_call_id(date_str, company_name)
             meetings = self.meeting_insights_repo.find_by_deal_and_date(deal_name, date_str)
             if call_id and not meetings:
                 meeting_id = f"{deal_name}_{date_str}"
@@ -265,16 +355,16 @@ class DataSyncService:
                             )
                         
                 except Exception as e:
-                    print(Fore.RED + f"Error syncing meeting insights for meeting {meeting_id} in deal {deal_name}: {str(e)}" + Style.RESET_ALL)
+                    logger.error("Error syncing meeting insights for meeting %s in deal %s: %s", meeting_id, deal_name, e)
                     continue
                     
         except Exception as e:
-            print(Fore.RED + f"Error syncing meeting insights for deal {deal_name} on {date_str}: {str(e)}" + Style.RESET_ALL)
+            logger.error("Error syncing meeting insights for deal %s on %s: %s", deal_name, date_str, e)
             raise
 
     def _sync_timeline_events(self, deal_name: str, start_date: datetime, end_date: datetime) -> None:
         try:
-            print(Fore.YELLOW + f"Syncing timeline events for {deal_name}." + Style.RESET_ALL)
+            logger.info("Syncing timeline events for %s.", deal_name)
             timeline_data = self.hubspot_service.get_deal_timeline(deal_name)
             
             # Filter events to only include those within our date range
@@ -287,28 +377,78 @@ class DataSyncService:
                 
             self.deal_timeline_repo.upsert_timeline(deal_name, timeline_data)
         except Exception as e:
-            print(Fore.RED + f"Error getting timeline data: {str(e)}" + Style.RESET_ALL)
+            logger.error("Error getting timeline data: %s", e)
+
+    def _overview_is_fresh(self, existing: Optional[Dict]) -> bool:
+        """Whether a stored company_overview document is recent enough to skip refreshing"""
+        if not existing or is_failed_analysis(existing.get("overview")):
+            # A failed Firecrawl/LLM lookup is retried on the next sync instead of kept for the TTL
+            return False
+        last_updated = existing.get("last_updated")
+        return bool(last_updated and last_updated > datetime.utcnow() - COMPANY_OVERVIEW_TTL)
+
+    def _prefetch_company_overviews(self, deal_names: List[str]) -> set:
+        """Run the Firecrawl analyses for every stale deal up front, in parallel,
+        so the per-deal sync_company_overviews calls are served from _overview_cache.
+        Returns the stale deal names, so callers don't check freshness again."""
+        # One query for every deal's stored overview instead of one per deal
+        existing_by_deal = {
+            doc["deal_id"]: doc
+            for doc in self.company_overview_repo.find_many(
+                {"deal_id": {"$in": list(set(deal_names))}},
+                {"deal_id": 1, "overview": 1, "last_updated": 1}
+            )
+        }
+        stale_deals = {
+            deal_name for deal_name in deal_names
+            if not self._overview_is_fresh(existing_by_deal.get(deal_name))
+        }
 
-    def sync_company_overviews(self, deal_name: str) -> None:
+        company_names = set()
+        for deal_name in stale_deals:
+            company_name = extract_company_name(deal_name)
+            if company_name and company_name != "Unknown Company" and company_name not in self._overview_cache:
+                company_names.add(company_name)
+
+        if company_names:
+            logger.info("Fetching company overviews for %d companies", len(company_names))
+            self._overview_cache.update(get_company_analyses(list(company_names)))
+        return stale_deals
+
+    @_sync_run
+    def sync_company_overviews(self, deal_name: str, company_name: Optional[str] = None, stale: Optional[bool] = None) -> None:
+        """Refresh the deal's company overview if it is stale. Pass stale when it is already
+        known (e.g. from _prefetch_company_overviews) to skip the freshness query."""
         try:
             # Extract company name from deal name
-            company_name = extract_company_name(deal_name)
+            if company_name is None:
+                company_name = extract_company_name(deal_name)
             
             if not company_name or company_name == "Unknown Company":
-                print(Fore.RED + f"Could not extract a valid company name for deal {deal_name}" + Style.RESET_ALL)
+                logger.error("Could not extract a valid company name for deal %s", deal_name)
                 return
             
-            # Get company analysis from Firecrawl
-            overview = get_company_analysis(company_name)
+            if stale is None:
+                stale = not self._overview_is_fresh(self.company_overview_repo.get_by_deal_id(deal_name))
+            if not stale:
+                logger.info("Company overview for %s is up to date, skipping", company_name)
+                return
+
+            # Get company analysis from Firecrawl, once per company per run
+            overview = self._overview_cache.get(company_name)
+            if overview is None:
+                overview = get_company_analysis(company_name)
+                self._overview_cache[company_name] = overview
 
             # Store in MongoDB
             self.company_overview_repo.upsert_by_deal_id(deal_name, overview)
-            print(Fore.GREEN + f"Synced company overview for {company_name}" + Style.RESET_ALL)
+            logger.info("Synced company overview for %s", company_name)
                 
         except Exception as e:
-            print(Fore.RED + f"Error syncing company overviews: {str(e)}" + Style.RESET_ALL)
+            logger.error("Error syncing company overviews: %s", e)
             raise
 
+    @_sync_run
     def sync_single_deal(self, deal_name: str, epoch0: int = 3) -> None:
         """
         Sync data for a single deal within the specified date range.
@@ -321,28 +461,31 @@ class DataSyncService:
             end_date = datetime.now()
             start_date = end_date - timedelta(days=epoch0)
             
-            print(Fore.YELLOW + f"\n### Syncing Global Data for: {deal_name} from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')} ###" + Style.RESET_ALL)
+            logger.info("### Syncing Global Data for: %s from %s to %s ###", deal_name, start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
             
+            company_name = extract_company_name(deal_name)
+            date_strs = date_range_strs(start_date, end_date)
+
             # Sync global deal data
-            self.sync_global_deal_data(deal_name, start_date, end_date)
+            self.sync_global_deal_data(deal_name, start_date, end_date, company_name, date_strs)
             
             # Sync company overview
-            self.sync_company_overviews(deal_name)
+            self.sync_company_overviews(deal_name, company_name)
 
             # Sync meeting data for each day in the range
-            current_date = start_date
-            while current_date <= end_date:
-                current_date_str = current_date.strftime("%Y-%m-%d")
-                self._sync_meeting_insights(deal_name, current_date_str)
-                current_date += timedelta(days=1)
+            for current_date_str in date_strs:
+                self._sync_meeting_insights(deal_name, current_date_str, company_name)
 
-            print(Fore.GREEN + f"\nSuccessfully synced all data for deal: {deal_name}" + Style.RESET_ALL)
+            logger.info("Successfully synced all data for deal: %s", deal_name)
 
         except Exception as e:
-            print(Fore.RED + f"Error syncing deal data: {str(e)}" + Style.RESET_ALL)
+            logger.error("Error syncing deal data: %s", e)
             raise
 
 if __name__ == "__main__":
+    from app.core.logging_config import configure_logging
+    configure_logging()
+
     # Create event loop and run sync
     loop = asyncio.get_event_loop()
     sync_service = DataSyncService()
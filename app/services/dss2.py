@@ -1,18 +1,42 @@
 import os
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
 
-from app.services.gong_service import GongService
+from app.services.gong_service import GongService, filter_filler_words
 from app.repositories.deal_info_repository import DealInfoRepository
 from app.repositories.deal_insights_repository import DealInsightsRepository
 from app.repositories.deal_timeline_repository import DealTimelineRepository
 from app.repositories.meeting_insights_repository import MeetingInsightsRepository
-from app.utils.general_utils import extract_company_name
+from app.utils.general_utils import extract_company_name, parse_iso_date, date_range_strs, content_hash
 from app.services.hubspot_service import HubspotService
-from colorama import Fore, Style
+import logging
 import time
+import concurrent.futures
+import threading
 from app.repositories.deal_owner_performance_repository import DealOwnerPerformanceRepository
 
+logger = logging.getLogger(__name__)
+
+# Same as strftime('%b') in the C locale, without the per-call locale lookup
+_MONTH_ABBRS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+# Owner performance is recomputed in the background after a sync; one at a time is enough
+_owner_performance_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+_pending_background_tasks: set = set()
+# Done-callbacks discard from worker threads while shutdown snapshots the set
+_pending_background_tasks_lock = threading.Lock()
+
+def wait_for_background_tasks(timeout: Optional[float] = None) -> None:
+    """Block until background owner-performance syncs finish (used on shutdown)"""
+    with _pending_background_tasks_lock:
+        pending = list(_pending_background_tasks)
+    concurrent.futures.wait(pending, timeout=timeout)
+
+# Deals are I/O bound (HubSpot, Gong, LLM, Mongo); sync this many at once
+DEAL_SYNC_MAX_WORKERS = 8
+# Days in a date range synced at once; each day fans out over deals as well
+DATE_SYNC_MAX_WORKERS = 4
+
 class DataSyncService2:
 
     def __init__(self):
@@ -23,89 +47,194 @@ class DataSyncService2:
         self.deal_timeline_repo = DealTimelineRepository()
         self.meeting_insights_repo = MeetingInsightsRepository()
         self.deal_owner_performance_repo = DealOwnerPerformanceRepository()
+        # date_str -> Future of the Gong calls for that date, shared by every deal in a sync run
+        self._calls_by_date = {}
+        # date_str -> meaningful words across all of that day's call titles
+        self._call_words_by_date = {}
+        self._calls_lock = threading.Lock()
+
+    def _list_calls_cached(self, date_str: str) -> List[Dict]:
+        """Gong calls for a date, fetched once per sync run.
+
+        The lock only guards the dict; the first caller for a date fetches outside it,
+        so only callers for that same date wait on its Future.
+        """
+        with self._calls_lock:
+            future = self._calls_by_date.get(date_str)
+            owner = future is None
+            if owner:
+                future = self._calls_by_date[date_str] = concurrent.futures.Future()
 
-    def _format_signal_date(self, event_date) -> str:
-        """Convert event date to format like '31 Mar 2025'"""
+        if owner:
+            try:
+                # Deals are matched on titles only, so skip the per-call attendee lookups
+                future.set_result(self.gong_service.list_calls_between(
+                    f"{date_str}T00:00:00Z", f"{date_str}T23:59:59Z", include_attendees=False
+                ))
+            except Exception as e:
+                # Let the next caller retry instead of caching the failure
+                with self._calls_lock:
+                    if self._calls_by_date.get(date_str) is future:
+                        del self._calls_by_date[date_str]
+                future.set_exception(e)
+        return future.result()
+
+    def _call_title_words(self, date_str: str) -> set:
+        """Union of the filtered title words of every Gong call on a date"""
+        words = self._call_words_by_date.get(date_str)
+        if words is None:
+            # Tokenize outside the lock; a racing duplicate computes the same set
+            words = set()
+            for call in self._list_calls_cached(date_str):
+                words |= filter_filler_words(call.get("title", ""))
+            with self._calls_lock:
+                words = self._call_words_by_date.setdefault(date_str, words)
+        return words
+
+    def _company_in_calls(self, date_str: str, company_name: str) -> bool:
+        """Cheap pre-check with the same token matching as GongService.get_call_id"""
+        title_words = self._call_title_words(date_str)
+        return any(filter_filler_words(synonym.strip()) & title_words for synonym in company_name.split(","))
+
+    def _clear_calls_cache(self, date_str: str) -> None:
+        with self._calls_lock:
+            self._calls_by_date.pop(date_str, None)
+            self._call_words_by_date.pop(date_str, None)
+
+    def _format_signal_date(self, event_date) -> Tuple[str, Optional[date]]:
+        """Convert event date to format like '31 Mar 2025'
+
+        Also returns the calendar date so callers can sort without re-parsing the string.
+        """
         if isinstance(event_date, datetime):
             dt = event_date
         elif isinstance(event_date, str):
             try:
-                # Parse ISO format date
-                dt = datetime.fromisoformat(event_date.replace('Z', '+00:00'))
+                # Parse ISO format date (memoized; the same dates recur across events)
+                dt = parse_iso_date(event_date)
             except (ValueError, TypeError):
-                return ""
+                return "", None
         else:
-            return ""
+            return "", None
         
-        # Format as "DD MMM YYYY"
-        return dt.strftime('%d %b %Y').lstrip('0')  # Remove leading zero from day
+        # Format as "D MMM YYYY" without going through strftime
+        return f"{dt.day} {_MONTH_ABBRS[dt.month - 1]} {dt.year}", dt.date()
+
+    def _sync_one_deal(self, deal_name: str, date_str: str, hubspot_deal: Optional[Dict] = None) -> bool:
+        """Sync info, insights, timeline and meetings for one deal on one date
+
+        hubspot_deal is the deal as returned by get_all_deals, when the caller already has it.
+
+        Returns:
+            bool: True if the deal had any new activity on that date
+        """
+        try:
+            t = time.time()
+            company_name = extract_company_name(deal_name)
+
+            # Sync deal info (always runs, doesn't indicate new activity)
+            self._sync_deal_info(deal_name, company_name, hubspot_deal)
+
+            # Track activity from these sync operations
+            insights_activity, meeting_activity = self._sync_gong_for_deal(deal_name, date_str, company_name)
+            timeline_activity = self._sync_timeline_events(deal_name, date_str)
+
+            # Check if this deal had any new activity
+            deal_had_activity = bool(insights_activity or timeline_activity or meeting_activity)
+            if deal_had_activity:
+                logger.info("✓ Found new activity for deal: %s", deal_name)
+            else:
+                logger.info("- No new activity for deal: %s", deal_name)
+
+            elapsed = time.time() - t
+            logger.info("Done syncing deal %s for date %s.\nTook %.2f seconds", deal_name, date_str, elapsed)
+            return deal_had_activity
+
+        except Exception as e:
+            logger.error("Error processing deal %s: %s", deal_name, e)
+            return False
+
+    def _sync_deals_concurrently(self, deals: List[Dict], date_str: str) -> Dict[str, bool]:
+        """Run _sync_one_deal for every HubSpot deal on a thread pool, returning deal_name -> had activity"""
+        results = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=DEAL_SYNC_MAX_WORKERS) as executor:
+            future_to_deal = {
+                executor.submit(self._sync_one_deal, deal["dealname"], date_str, deal): deal["dealname"]
+                for deal in deals if deal.get("dealname")
+            }
+            for future in concurrent.futures.as_completed(future_to_deal):
+                results[future_to_deal[future]] = future.result()
+        return results
+
+    def _run_for_dates(self, sync_fn, dates: List[str]) -> None:
+        """Call sync_fn(date_str) for every date on a thread pool"""
+        with concurrent.futures.ThreadPoolExecutor(max_workers=DATE_SYNC_MAX_WORKERS) as executor:
+            future_to_date = {executor.submit(sync_fn, date_str): date_str for date_str in dates}
+            for future in concurrent.futures.as_completed(future_to_date):
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error("Error syncing date %s: %s", future_to_date[future], e)
 
     def sync_stage_on_date(self, stage_name: str, date_str: str) -> None:
         """Sync all deals in a specific stage for a single date"""
-        print(Fore.MAGENTA + f"Syncing data for stage: {stage_name}, date: {date_str}" + Style.RESET_ALL)
+        logger.info("Syncing data for stage: %s, date: %s", stage_name, date_str)
         
-        all_deals = self.hubspot_service.get_all_deals()
-        filtered_deals = [deal for deal in all_deals if deal.get("stage", "").lower() == stage_name.lower()]
-        print(Fore.MAGENTA + f"Filtered to {len(filtered_deals)} deals in stage: {stage_name}" + Style.RESET_ALL)
-
-        for deal in filtered_deals:
-            try:
-                deal_name = deal.get("dealname")
-                if not deal_name:
-                    continue
-
-                print(Fore.YELLOW + f"\nProcessing deal: {deal_name}" + Style.RESET_ALL)
-                self._sync_deal_info(deal_name)
-                self._sync_deal_insights(deal_name, date_str)
-                self._sync_timeline_events(deal_name, date_str)
-                self._sync_meeting_insights(deal_name, date_str)
+        filtered_deals = self.hubspot_service.get_deals_in_stage(stage_name)
+        logger.info("Filtered to %s deals in stage: %s", len(filtered_deals), stage_name)
 
-            except Exception as e:
-                print(Fore.RED + f"Error processing deal {deal_name}: {str(e)}" + Style.RESET_ALL)
-                continue
-        print(Fore.GREEN + f"Successfully synced stage {stage_name} for date: {date_str}" + Style.RESET_ALL)
+        try:
+            self._sync_deals_concurrently(filtered_deals, date_str)
+        finally:
+            self._clear_calls_cache(date_str)
+        logger.info("Successfully synced stage %s for date: %s", stage_name, date_str)
 
     def sync_stage_date_range(self, stage_name: str, start_date: str, end_date: str) -> None:
         """Sync all deals in a specific stage for a date range"""
-        print(Fore.MAGENTA + f"Syncing data for stage: {stage_name}, from {start_date} to {end_date}" + Style.RESET_ALL)
+        logger.info("Syncing data for stage: %s, from %s to %s", stage_name, start_date, end_date)
         
         start = datetime.strptime(start_date, "%Y-%m-%d")
         end = datetime.strptime(end_date, "%Y-%m-%d")
-        current_date = start
+        dates = date_range_strs(start, end)
+
+        # Days are independent, so sync them in parallel
+        self._run_for_dates(lambda date_str: self.sync_stage_on_date(stage_name, date_str), dates)
 
-        while current_date <= end:
-            current_date_str = current_date.strftime("%Y-%m-%d")
-            self.sync_stage_on_date(stage_name, current_date_str)
-            current_date += timedelta(days=1)
+        logger.info("Successfully synced stage %s for date range: %s to %s", stage_name, start_date, end_date)
 
-        print(Fore.GREEN + f"Successfully synced stage {stage_name} for date range: {start_date} to {end_date}" + Style.RESET_ALL)
 
+    def sync_deal_on_date(self, deal_name: str, date_str: str) -> Tuple[bool, bool]:
+        """Sync a specific deal for a single date
 
-    def sync_deal_on_date(self, deal_name: str, date_str: str) -> None:
-        """Sync a specific deal for a single date"""
-        print(Fore.YELLOW + f"Syncing data for DEAL: {deal_name}, DATE: {date_str}" + Style.RESET_ALL)
+        Returns:
+            Tuple[bool, bool]: (insights_activity, meeting_activity) from the Gong pass
+        """
+        insights_activity, meeting_activity = False, False
+        logger.info("Syncing data for DEAL: %s, DATE: %s", deal_name, date_str)
         
         try:
+            company_name = extract_company_name(deal_name)
+
             # 1. Sync deal info if it's a new deal
-            print('## Syncing deal_info')
-            self._sync_deal_info(deal_name)
+            logger.debug("## Syncing deal_info")
+            self._sync_deal_info(deal_name, company_name)
 
-            # 2. Sync deal insights
-            print('## Syncing deal_insights')
-            self._sync_deal_insights(deal_name, date_str)
+            # 2. Sync deal insights and meeting insights from the same Gong call
+            logger.debug("## Syncing deal_insights and meeting_insights")
+            insights_activity, meeting_activity = self._sync_gong_for_deal(deal_name, date_str, company_name)
 
             # 3. Sync timeline events
-            print('## Syncing deal_timeline')
+            logger.debug("## Syncing deal_timeline")
             self._sync_timeline_events(deal_name, date_str)
-
-            # 4. Sync meeting insights
-            print('## Syncing meeting_insights')
-            self._sync_meeting_insights(deal_name, date_str)
             
-            print(Fore.GREEN + f"Successfully synced deal {deal_name} for date {date_str}" + Style.RESET_ALL)
+            logger.info("Successfully synced deal %s for date %s", deal_name, date_str)
             
         except Exception as e:
-            print(Fore.RED + f"Error processing deal {deal_name}: {str(e)}" + Style.RESET_ALL)
+            logger.error("Error processing deal %s: %s", deal_name, e)
+        finally:
+            self._clear_calls_cache(date_str)
+
+        return insights_activity, meeting_activity
 
     def sync_deal_date_range(self, deal_name: str, start_date: str, end_date: str) -> None:
         """Sync a specific deal for a date range
@@ -119,22 +248,19 @@ class DataSyncService2:
             start_date: Start date in YYYY-MM-DD format
             end_date: End date in YYYY-MM-DD format (inclusive)
         """
-        print(Fore.YELLOW + f"Syncing data for DEAL: {deal_name}, from {start_date} to {end_date}" + Style.RESET_ALL)
+        logger.info("Syncing data for DEAL: %s, from %s to %s", deal_name, start_date, end_date)
         
         start = datetime.strptime(start_date, "%Y-%m-%d")
         end = datetime.strptime(end_date, "%Y-%m-%d")
         
         # Clear existing timeline events for this date range first
-        print(Fore.CYAN + f"🗑️  Clearing existing timeline events for {deal_name} from {start_date} to {end_date}" + Style.RESET_ALL)
+        logger.info("🗑️  Clearing existing timeline events for %s from %s to %s", deal_name, start_date, end_date)
         self._clear_timeline_events_for_date_range(deal_name, start, end)
         
-        current_date = start
-        while current_date <= end:
-            current_date_str = current_date.strftime("%Y-%m-%d")
-            self.sync_deal_on_date(deal_name, current_date_str)
-            current_date += timedelta(days=1)
+        dates = date_range_strs(start, end)
+        self._run_for_dates(lambda date_str: self.sync_deal_on_date(deal_name, date_str), dates)
 
-        print(Fore.GREEN + f"Successfully synced deal {deal_name} for date range {start_date} to {end_date}" + Style.RESET_ALL)
+        logger.info("Successfully synced deal %s for date range %s to %s", deal_name, start_date, end_date)
 
     def _clear_timeline_events_for_date_range(self, deal_name: str, start_date: datetime, end_date: datetime) -> None:
         """Clear existing timeline events for a deal within the specified date range"""
@@ -143,7 +269,7 @@ class DataSyncService2:
             timeline_document = self.deal_timeline_repo.get_by_deal_id(deal_name)
             
             if not timeline_document or "events" not in timeline_document:
-                print(f"No existing timeline events found for {deal_name}")
+                logger.debug("No existing timeline events found for %s", deal_name)
                 return
             
             existing_events = timeline_document.get("events", [])
@@ -184,7 +310,7 @@ class DataSyncService2:
                     events_to_keep.append(event)
                 else:
                     events_removed += 1
-                    print(f"  Removing event: {event.get('subject', 'No subject')} on {event_date}")
+                    logger.debug("  Removing event: %s on %s", event.get('subject', 'No subject'), event_date)
             
             # Update the timeline document with filtered events
             if events_removed > 0:
@@ -201,39 +327,39 @@ class DataSyncService2:
                     )
                     
                     if update_result:
-                        print(Fore.GREEN + f"✅ Removed {events_removed} existing events for {deal_name} in date range {start_date.date()} to {end_date.date()}" + Style.RESET_ALL)
-                        print(Fore.BLUE + f"📊 Kept {len(events_to_keep)} events outside the date range" + Style.RESET_ALL)
+                        logger.info("✅ Removed %s existing events for %s in date range %s to %s", events_removed, deal_name, start_date.date(), end_date.date())
+                        logger.info("📊 Kept %s events outside the date range", len(events_to_keep))
                     else:
-                        print(Fore.RED + f"Failed to update timeline document for {deal_name}" + Style.RESET_ALL)
+                        logger.error("Failed to update timeline document for %s", deal_name)
                 except Exception as update_error:
-                    print(Fore.RED + f"Error updating timeline document for {deal_name}: {str(update_error)}" + Style.RESET_ALL)
+                    logger.error("Error updating timeline document for %s: %s", deal_name, update_error)
             else:
-                print(f"No events found in the specified date range for {deal_name}")
+                logger.debug("No events found in the specified date range for %s", deal_name)
                 
         except Exception as e:
-            print(Fore.RED + f"Error clearing timeline events for {deal_name}: {str(e)}" + Style.RESET_ALL)
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error clearing timeline events for %s: %s", deal_name, e)
+
+    def sync_all_stages_on_date(self, date_str: str) -> Optional[concurrent.futures.Future]:
+        """Sync all deals across all stages for a single date
 
-    def sync_all_stages_on_date(self, date_str: str) -> None:
-        """Sync all deals across all stages for a single date"""
-        print(Fore.MAGENTA + f"Syncing data for ALL stages on date: {date_str}" + Style.RESET_ALL)
+        Returns:
+            The Future of the background owner-performance sync, or None if no deal had activity
+        """
+        logger.info("Syncing data for ALL stages on date: %s", date_str)
         
         all_deals = self.hubspot_service.get_all_deals()
-        print(Fore.MAGENTA + f"Found {len(all_deals)} total deals to sync" + Style.RESET_ALL)
+        logger.info("Found %s total deals to sync", len(all_deals))
 
 
         #============================================================
         # Filter the deals that either had Hubspot Activity, or had a Gong Call on the given date
         #============================================================
 
-        print(Fore.CYAN + f"Pre-filtering deals with activity on {date_str}..." + Style.RESET_ALL)
+        logger.info("Pre-filtering deals with activity on %s...", date_str)
 
-        print("[Gong] Listing calls for date.")
-        gong_calls = self.gong_service.list_calls(date_str)
-        print(Fore.GREEN + f"Found {len(gong_calls)} Gong calls on {date_str}" + Style.RESET_ALL)
-
-        from app.services.gong_service import filter_filler_words
+        logger.debug("[Gong] Listing calls for date.")
+        gong_calls = self._list_calls_cached(date_str)
+        logger.info("Found %s Gong calls on %s", len(gong_calls), date_str)
 
         gong_matched_deals = []
         for call in gong_calls:
@@ -264,63 +390,43 @@ class DataSyncService2:
                     break
 
         if len(gong_matched_deals) == 0:
-            print(Fore.CYAN + "No Gong matches found." + Style.RESET_ALL)
+            logger.info("No Gong matches found.")
 
         gong_matched_deal_names = {match['deal_name'] for match in gong_matched_deals}
         deals_with_any_engagement_on_date = [
             deal for deal in all_deals if deal.get("dealname") in gong_matched_deal_names
         ]
-        print(Fore.GREEN + f"[Hubspot] Found {len(deals_with_any_engagement_on_date)} deals with any engagement on {date_str}" + Style.RESET_ALL)
+        logger.info("[Hubspot] Found %s deals with any engagement on %s", len(deals_with_any_engagement_on_date), date_str)
         #============================================================
 
         # Track if any deals had new activity
         any_activity_found = False
         deals_with_activity = []
 
-        print(f"Step 3: Sync {len(deals_with_any_engagement_on_date)} deals.")
-
-        for deal in deals_with_any_engagement_on_date:
-            try:
-                deal_name = deal.get("dealname")
-                if not deal_name:
-                    continue
+        logger.debug("Step 3: Sync %s deals.", len(deals_with_any_engagement_on_date))
 
-                t = time.time()
-                
-                # Sync deal info (always runs, doesn't indicate new activity)
-                self._sync_deal_info(deal_name)
-                
-                # Track activity from these sync operations
-                insights_activity = self._sync_deal_insights(deal_name, date_str)
-                timeline_activity = self._sync_timeline_events(deal_name, date_str)
-                meeting_activity = self._sync_meeting_insights(deal_name, date_str)
-                
-                # Check if this deal had any new activity
-                deal_had_activity = insights_activity or timeline_activity or meeting_activity
-                if deal_had_activity:
-                    any_activity_found = True
-                    deals_with_activity.append(deal_name)
-                    print(Fore.GREEN + f"✓ Found new activity for deal: {deal_name}" + Style.RESET_ALL)
-                else:
-                    print(Fore.LIGHTBLACK_EX + f"- No new activity for deal: {deal_name}" + Style.RESET_ALL)
-                
-                elapsed = time.time() - t
-                print(Fore.GREEN + f"Done syncing deal {deal_name} for date {date_str}.\nTook {elapsed:.2f} seconds" + Style.RESET_ALL)
+        try:
+            deal_results = self._sync_deals_concurrently(deals_with_any_engagement_on_date, date_str)
+        finally:
+            self._clear_calls_cache(date_str)
 
-            except Exception as e:
-                print(Fore.RED + f"Error processing deal {deal_name}: {str(e)}" + Style.RESET_ALL)
-                continue
+        for deal_name, deal_had_activity in deal_results.items():
+            if deal_had_activity:
+                any_activity_found = True
+                deals_with_activity.append(deal_name)
 
         # Only sync deal owner performance if there was any activity
         if any_activity_found:
-            print(Fore.CYAN + f"🔄 Found activity in {len(deals_with_activity)} deals: {', '.join(deals_with_activity[:5])}" + 
-                  (f" and {len(deals_with_activity) - 5} more..." if len(deals_with_activity) > 5 else "") + Style.RESET_ALL)
-            print(Fore.CYAN + "Syncing deal owner performance data due to new activity..." + Style.RESET_ALL)
-            self.sync_deal_owner_performance()
+            logger.info("🔄 Found activity in %s deals: %s%s", len(deals_with_activity), ', '.join(deals_with_activity[:5]),
+                        f" and {len(deals_with_activity) - 5} more..." if len(deals_with_activity) > 5 else "")
+            logger.info("Syncing deal owner performance data due to new activity (in background)...")
+            owner_performance_future = self.sync_deal_owner_performance_in_background()
         else:
-            print(Fore.YELLOW + "⏭️  No new activity found for any deals. Skipping deal owner performance sync." + Style.RESET_ALL)
+            logger.info("⏭️  No new activity found for any deals. Skipping deal owner performance sync.")
+            owner_performance_future = None
 
-        print(Fore.GREEN + f"## Successfully synced all stages for date: {date_str}" + Style.RESET_ALL)
+        logger.info("## Successfully synced all stages for date: %s", date_str)
+        return owner_performance_future
 
     # Keeping the original sync method for backward compatibility
     def sync(self, date_str: str, stage: str = "all", deal_name: Optional[str] = None) -> None:
@@ -339,16 +445,38 @@ class DataSyncService2:
                         continue
                     self.sync_deal_on_date(deal_name, date_str)
                 except Exception as e:
-                    print(Fore.RED + f"Error processing deal {deal_name}: {str(e)}" + Style.RESET_ALL)
+                    logger.error("Error processing deal %s: %s", deal_name, e)
                     continue
 
+    def sync_deal_owner_performance_in_background(self) -> concurrent.futures.Future:
+        """Queue sync_deal_owner_performance without waiting for it to finish"""
+        future = _owner_performance_executor.submit(self.sync_deal_owner_performance)
+        with _pending_background_tasks_lock:
+            _pending_background_tasks.add(future)
+        future.add_done_callback(self._on_background_task_done)
+        return future
+
+    @staticmethod
+    def _on_background_task_done(future: concurrent.futures.Future) -> None:
+        with _pending_background_tasks_lock:
+            _pending_background_tasks.discard(future)
+        if not future.cancelled() and future.exception() is not None:
+            logger.error("Background deal owner performance sync failed: %s", future.exception())
+
     def sync_deal_owner_performance(self) -> None:
         """Sync deal owner performance data to MongoDB"""
-        print(Fore.MAGENTA + "Syncing deal owner performance data" + Style.RESET_ALL)
+        logger.info("Syncing deal owner performance data")
 
         # Step 1: Get all deals
         all_deals = self.deal_info_repo.get_all_deals()
-        print(Fore.GREEN + f"Found {len(all_deals)} deals" + Style.RESET_ALL)
+        logger.info("Found %s deals", len(all_deals))
+
+        # Let Mongo unwind and group the meeting events; only (deal, intent) -> dates comes back
+        sentiments = ['very likely to buy', 'likely to buy', 'less likely to buy', 'neutral']
+        intent_dates_by_deal = self.deal_timeline_repo.get_meeting_intent_dates(
+            [deal.get('deal_name') for deal in all_deals if deal.get('deal_name')],
+            sentiments
+        )
 
         # Step 2: Group deals by owner
         owner_deals_map = {}
@@ -361,6 +489,7 @@ class DataSyncService2:
             owner_deals_map[owner].append(deal.get('deal_name'))
 
         # Step 4: Calculate performance for each owner
+        owner_performance_records = []
         for owner, deals in owner_deals_map.items():
             performance = {
                 "likely to buy": {"count": 0, "deals": {}},
@@ -370,50 +499,39 @@ class DataSyncService2:
             }
 
             for deal_name in deals:
-                timeline_data = self.deal_timeline_repo.get_by_deal_id(deal_name)
-                if not timeline_data:
+                intent_dates = intent_dates_by_deal.get(deal_name)
+                if not intent_dates:
                     continue
 
                 deal_sentiment_dates = {}
 
-                for event in timeline_data.get('events', []):
-                    if event.get('event_type') != 'Meeting':
-                        continue
-                    
-                    buyer_intent = str(event.get('buyer_intent', 'Unknown')).lower()
-                    if buyer_intent not in ('very likely to buy', 'likely to buy', 'less likely to buy', 'neutral'):
-                        continue
-                    
-                    # Get the event date and format it
-                    event_date = event.get('event_date')
-                    formatted_date = self._format_signal_date(event_date)
-                    
-                    if formatted_date:
-                        if buyer_intent not in deal_sentiment_dates:
-                            deal_sentiment_dates[buyer_intent] = set()
-                        deal_sentiment_dates[buyer_intent].add(formatted_date)
-                        performance[buyer_intent]["count"] += 1
+                for buyer_intent, event_dates in intent_dates.items():
+                    for event_date in event_dates:
+                        # Format the event date
+                        formatted_date, signal_date = self._format_signal_date(event_date)
+
+                        if formatted_date:
+                            if buyer_intent not in deal_sentiment_dates:
+                                deal_sentiment_dates[buyer_intent] = {}
+                            deal_sentiment_dates[buyer_intent][formatted_date] = signal_date
+                            performance[buyer_intent]["count"] += 1
 
                 # Add deal to the deals dict for sentiments it contributed to
                 for buyer_intent, dates in deal_sentiment_dates.items():
                     if deal_name not in performance[buyer_intent]["deals"]:
-                        performance[buyer_intent]["deals"][deal_name] = set()
+                        performance[buyer_intent]["deals"][deal_name] = {}
                     performance[buyer_intent]["deals"][deal_name].update(dates)
 
-            # Convert sets to lists for JSON serialization
+            # Convert the formatted-date -> date maps to sorted lists for JSON serialization
             formatted_performance = {}
             for sentiment, data in performance.items():
                 deals_list = []
                 for deal_name, signal_dates in data["deals"].items():
                     # Sort dates by recency (most recent first)
-                    def parse_date_for_sorting(date_str):
-                        try:
-                            return datetime.strptime(date_str, '%d %b %Y')
-                        except ValueError:
-                            # If parsing fails, return a very old date so it goes to the end
-                            return datetime(1900, 1, 1)
-                    
-                    sorted_dates = sorted(list(signal_dates), key=parse_date_for_sorting, reverse=True)
+                    sorted_dates = [
+                        formatted for formatted, _ in
+                        sorted(signal_dates.items(), key=lambda item: item[1], reverse=True)
+                    ]
                     deals_list.append({
                         "deal_name": deal_name,
                         "signal_dates": sorted_dates
@@ -424,26 +542,26 @@ class DataSyncService2:
                     "deals": deals_list
                 }
 
-            print(Fore.RED + f"Deleting owner performance for {owner}" + Style.RESET_ALL)
-            self.deal_owner_performance_repo.delete_owner_performance(owner)
-            print(Fore.RED + f"Inserting owner performance for {owner}" + Style.RESET_ALL)
-            self.deal_owner_performance_repo.insert_owner_performance(owner, formatted_performance)
+            owner_performance_records.append((owner, formatted_performance))
+
+        logger.info("[MongoDB] Replacing owner performance for %s owners", len(owner_performance_records))
+        self.deal_owner_performance_repo.bulk_replace(owner_performance_records)
 
-        print(Fore.GREEN + "Successfully synced deal owner performance data" + Style.RESET_ALL)
+        logger.info("Successfully synced deal owner performance data")
 
-    def _sync_deal_info(self, deal_name: str) -> None:
+    def _sync_deal_info(self, deal_name: str, company_name: str, hubspot_deal: Optional[Dict] = None) -> None:
         """Sync deal info if it doesn't exist in MongoDB"""
         try:
 
-            # Get deal info from HubSpot
-            hubspot_deal = self._get_hubspot_deal_info(deal_name)
+            # Get deal info from HubSpot, unless the caller already fetched it
+            if hubspot_deal is None:
+                hubspot_deal = self._get_hubspot_deal_info(deal_name)
             if not hubspot_deal:
-                print(Fore.RED + f"[Hubspot] Could not find deal '{deal_name}'" + Style.RESET_ALL)
+                logger.error("[Hubspot] Could not find deal '%s'", deal_name)
                 return
 
-            company_name = extract_company_name(deal_name)
             if company_name == "Unknown Company":
-                print(Fore.RED + f"Could not extract company name from deal name: {deal_name}" + Style.RESET_ALL)
+                logger.error("Could not extract company name from deal name: %s", deal_name)
                 return
 
             amount = hubspot_deal.get("amount", "N/A")
@@ -464,57 +582,92 @@ class DataSyncService2:
                 "last_modified_date": datetime.now()
             }
 
-            print(Fore.BLUE + f"[MongoDB] Creating new DealInfo for {deal_name}" + Style.RESET_ALL)
+            # Only write when one of the HubSpot-derived fields actually changed
+            deal_info["content_hash"] = content_hash(
+                {k: deal_info[k] for k in ("deal_id", "stage", "owner", "amount", "company_name", "created_date")}
+            )
+            if self.deal_info_repo.get_content_hash(deal_name) == deal_info["content_hash"]:
+                logger.debug("DealInfo for %s is unchanged, skipping update.", deal_name)
+                return
+
+            logger.info("[MongoDB] Updating DealInfo for %s", deal_name)
             self.deal_info_repo.upsert_deal(deal_name, deal_info)
 
         except Exception as e:
-            print(Fore.RED + f"Error syncing deal info: {str(e)}" + Style.RESET_ALL)
+            logger.error("Error syncing deal info: %s", e)
+
+    def _sync_gong_for_deal(self, deal_name: str, date_str: str, company_name: str) -> Tuple[bool, bool]:
+        """Sync deal insights and meeting insights for a specific date
+
+        The Gong call is resolved once, then concerns and meeting insights are
+        fetched in parallel since they don't depend on each other.
 
-    def _sync_deal_insights(self, deal_name: str, date_str: str) -> bool:
-        """Sync deal insights for a specific date
-        
         Returns:
-            bool: True if new insights were found and processed, False otherwise
+            Tuple[bool, bool]: (insights_activity, meeting_activity)
         """
         try:
-            calls = self.gong_service.list_calls(date_str)
+            if not self._company_in_calls(date_str, company_name):
+                logger.info("[Gong] No call found for %s on %s", company_name, date_str)
+                return False, False
 
-            company_name = extract_company_name(deal_name)
-            print(f"[Gong] Extracting call ID for a call with company name: {company_name}")
+            calls = self._list_calls_cached(date_str)
+
+            logger.debug("[Gong] Extracting call ID for a call with company name: %s", company_name)
             call_id = self.gong_service.get_call_id(calls, company_name)
-            
-            if call_id:
-                print(Fore.YELLOW + f"Found Call ID: {call_id}" + Style.RESET_ALL)
-                new_concerns = self.gong_service.get_concerns(deal_name, date_str)
-                if not isinstance(new_concerns, dict):
-                    new_concerns = str(new_concerns)
-
-                if isinstance(new_concerns, dict):
-                    # Update insights data
-                    insights_data = {
-                        "deal_id": deal_name,
-                        "last_updated": datetime.now()
-                    }
-                    
-                    # Update counts based on new concerns
-                    pricing_concerns = new_concerns.get("pricing_concerns", {}).get("has_concerns", False)
-                    no_decision_maker = new_concerns.get("no_decision_maker", {}).get("is_issue", False)
-                    existing_vendor = new_concerns.get("already_has_vendor", {}).get("has_vendor", False)
-                    
-                    insights_data["pricing_concerns"] = 1 if pricing_concerns else 0
-                    insights_data["no_decision_maker"] = 1 if no_decision_maker else 0
-                    insights_data["existing_vendor"] = 1 if existing_vendor else 0
-                    
-                    print(Fore.BLUE + f"[MongoDB] Updating DealInsights with new concerns from {date_str}." + Style.RESET_ALL)
-                    self.deal_insights_repo.upsert_activity_with_concerns_list(deal_name, insights_data, new_concerns)
-                    return True  # Found and processed new insights
-            else:
-                print(Fore.RED + f"Did not find a call for {company_name} on {date_str}" + Style.RESET_ALL)
-                return False  # No call found, no new insights
-            
         except Exception as e:
-            print(Fore.RED + f"Error syncing deal insights: {str(e)}" + Style.RESET_ALL)
-            return False  # Error occurred, no new insights processed
+            logger.error("Error finding Gong call for %s: %s", deal_name, e)
+            return False, False
+
+        if not call_id:
+            logger.info("[Gong] No call found for %s on %s", company_name, date_str)
+            return False, False
+
+        logger.debug("Found Call ID: %s", call_id)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            concerns_future = executor.submit(self.gong_service.get_concerns, deal_name, date_str)
+            insights_future = executor.submit(self.gong_service.get_meeting_insights, call_id)
+
+        try:
+            insights_activity = self._store_deal_insights(deal_name, date_str, concerns_future.result())
+        except Exception as e:
+            logger.error("Error syncing deal insights: %s", e)
+            insights_activity = False  # Error occurred, no new insights processed
+
+        try:
+            meeting_activity = self._store_meeting_insights(deal_name, date_str, call_id, insights_future.result())
+        except Exception as e:
+            logger.error("Error syncing meeting insights: %s", e)
+            meeting_activity = False  # Error occurred, no meeting insights processed
+
+        return insights_activity, meeting_activity
+
+    def _store_deal_insights(self, deal_name: str, date_str: str, new_concerns: Any) -> bool:
+        """Store the concerns found in a call as deal insights
+
+        Returns:
+            bool: True if new insights were found and processed, False otherwise
+        """
+        if not isinstance(new_concerns, dict):
+            return False
+
+        # Update insights data
+        insights_data = {
+            "deal_id": deal_name,
+            "last_updated": datetime.now()
+        }
+
+        # Update counts based on new concerns
+        pricing_concerns = new_concerns.get("pricing_concerns", {}).get("has_concerns", False)
+        no_decision_maker = new_concerns.get("no_decision_maker", {}).get("is_issue", False)
+        existing_vendor = new_concerns.get("already_has_vendor", {}).get("has_vendor", False)
+
+        insights_data["pricing_concerns"] = 1 if pricing_concerns else 0
+        insights_data["no_decision_maker"] = 1 if no_decision_maker else 0
+        insights_data["existing_vendor"] = 1 if existing_vendor else 0
+
+        logger.info("[MongoDB] Updating DealInsights with new concerns from %s.", date_str)
+        self.deal_insights_repo.upsert_activity_with_concerns_list(deal_name, insights_data, new_concerns, date_str)
+        return True  # Found and processed new insights
 
     def _sync_timeline_events(self, deal_name: str, date_str: str) -> bool:
         """Sync timeline events for a specific date
@@ -524,89 +677,54 @@ class DataSyncService2:
         """
         try:
             start_date = datetime.strptime(date_str, '%Y-%m-%d')
-            end_date = datetime.strptime(date_str, '%Y-%m-%d').replace(hour=23, minute=59, second=59)
+            end_date = start_date + timedelta(hours=23, minutes=59, seconds=59)
 
-            print(f"[Hubspot] Getting timeline data between {start_date} and {end_date} (inclusive).")
+            logger.debug("[Hubspot] Getting timeline data between %s and %s (inclusive).", start_date, end_date)
             timeline_data = self.hubspot_service.get_deal_timeline(deal_name, date_range=(start_date, end_date))
 
             if not timeline_data:
                 return False
 
             if "events" not in timeline_data:
-                print("No events found in timeline data.")
+                logger.debug("No events found in timeline data.")
                 return False
 
             if timeline_data["events"]:
-                deal_timeline_document = self.deal_timeline_repo.get_by_deal_id(deal_name)
-
-                if deal_timeline_document:
-                    existing_events_by_subject = {}
-                    for event in deal_timeline_document["events"]:
-                        if event.get("subject"):
-                            subject = event.get("subject").strip().lower()
-                            existing_events_by_subject[subject] = event
-
-                    for new_event in timeline_data["events"]:
-                        if new_event.get("subject"):
-                            subject = new_event.get("subject").strip().lower()
-                            # If an event with this subject exists, remove it first
-                            if subject in existing_events_by_subject:
-                                print(f"[MongoDB] Removing older event with subject: {subject}")
-                                self.deal_timeline_repo.remove_event(deal_name, existing_events_by_subject[subject])
-                            # Add the new event
-                            print(Fore.YELLOW + f"[MongoDB] Adding new event with subject: {subject}" + Style.RESET_ALL)
-                            self.deal_timeline_repo.add_event(deal_name, new_event)
-                    return True  # Successfully processed timeline events
-                else:
-                    timeline_data["last_updated"] = datetime.now()
-                    self.deal_timeline_repo.upsert_timeline(deal_name, timeline_data)
-                    print(Fore.GREEN + f"[MongoDB] Successfully created new timeline for deal: {deal_name}" + Style.RESET_ALL)
-                    return True  # Successfully created new timeline
+                new_events = [event for event in timeline_data["events"] if event.get("subject")]
+
+                # Replace same-subject events and append the new ones in one round-trip. Days of
+                # the same deal sync in parallel, so the timeline is created atomically too
+                logger.info("[MongoDB] Replacing %s events by subject for deal: %s", len(new_events), deal_name)
+                self.deal_timeline_repo.bulk_replace_events(deal_name, new_events, upsert=True)
+                return True  # Successfully processed timeline events
             else:
-                print("No events to process in timeline data.")
+                logger.debug("No events to process in timeline data.")
                 return False  # No events found
         except Exception as e:
-            print(Fore.RED + f"[MongoDB] Error syncing deal_timeline. Deal: {deal_name}. Error: {str(e)}" + Style.RESET_ALL)
+            logger.error("[MongoDB] Error syncing deal_timeline. Deal: %s. Error: %s", deal_name, e)
             return False  # Error occurred, no timeline events processed
 
-    def _sync_meeting_insights(self, deal_name: str, date_str: str) -> bool:
-        """Sync meeting insights for a specific date
-        
+    def _store_meeting_insights(self, deal_name: str, date_str: str, call_id: str, insights: Optional[Dict]) -> bool:
+        """Store the meeting insights for a call
+
         Returns:
             bool: True if new meeting insights were found and processed, False otherwise
         """
-        try:
+        if not insights:
+            logger.info("No insights returned for call %s", call_id)
+            return False  # Call found but no insights
 
-            calls = self.gong_service.list_calls(date_str)
-            company_name = extract_company_name(deal_name)
-            call_id = self.gong_service.get_call_id(calls, company_name)
-            
-            if call_id:
-                print(Fore.GREEN + f"[Gong] Found 1 call match for {company_name} on {date_str}" + Style.RESET_ALL)    
-                insights = self.gong_service.get_meeting_insights(call_id)
+        insights["deal_name"] = deal_name
+        insights["date"] = date_str
 
-                if insights:
-                    insights["deal_name"] = deal_name
-                    insights["date"] = date_str
-                    
-                    # Ensure buyer_attendees is included
-                    if "buyer_attendees" not in insights:
-                        insights["buyer_attendees"] = []
-                    
-                    print(Fore.BLUE + f"[MongoDB] Updating MeetingInsights for {deal_name}" + Style.RESET_ALL)
-                    meeting_id = f"{deal_name}_{date_str}"
-                    self.meeting_insights_repo.upsert_meeting(deal_name, meeting_id, insights)
-                    return True  # Successfully processed meeting insights
-                else:
-                    print(Fore.YELLOW + f"No insights returned for call {call_id}" + Style.RESET_ALL)
-                    return False  # Call found but no insights
-            else:
-                print(Fore.RED + f"[Gong] No call found for {company_name} on {date_str}" + Style.RESET_ALL)
-                return False  # No call found
+        # Ensure buyer_attendees is included
+        if "buyer_attendees" not in insights:
+            insights["buyer_attendees"] = []
 
-        except Exception as e:
-            print(Fore.RED + f"Error syncing meeting insights: {str(e)}" + Style.RESET_ALL)
-            return False  # Error occurred, no meeting insights processed
+        logger.info("[MongoDB] Updating MeetingInsights for %s", deal_name)
+        meeting_id = f"{deal_name}_{date_str}"
+        self.meeting_insights_repo.upsert_meeting(deal_name, meeting_id, insights)
+        return True  # Successfully processed meeting insights
 
     def _get_hubspot_deal_info(self, deal_name: str) -> Optional[Dict]:
         """Get deal information from HubSpot"""
@@ -617,13 +735,13 @@ class DataSyncService2:
                     return deal
             return None
         except Exception as e:
-            print(Fore.RED + f"Error getting HubSpot deal info: {str(e)}" + Style.RESET_ALL)
+            logger.error("Error getting HubSpot deal info: %s", e)
             return None
 
     def _parse_date(self, date_str: Optional[str]) -> datetime:
         if not date_str:
             return datetime.now()
         try:
-            return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+            return parse_iso_date(date_str)
         except (ValueError, TypeError):
-            return datetime.now() 
\ No newline at end of file
+            return datetime.now()
@@ -3,42 +3,89 @@ from app.services.llm_service import ask_openai
 import os
 from dotenv import load_dotenv
 import json
+import concurrent.futures
+from typing import Any, Dict, List, Optional
 from colorama import Fore, Style
-from app.utils.prompts import company_name_prompt
+from app.utils.general_utils import extract_company_name
+from app.services.gong_service import LRUCache
 load_dotenv()
 
+_firecrawl_app = None
+
+# Company analyses run in parallel when several are requested at once
+COMPANY_ANALYSIS_MAX_WORKERS = 4
+
+# Company websites rarely change intra-day; cache scrapes and URL lookups for 24 hours.
+# get_company_analyses reads these from several threads, so they use the bounded, thread-safe LRUCache
+_SCRAPE_CACHE_TTL = 86400  # 24 hours in seconds
+_scrape_cache = LRUCache(capacity=256, ttl=_SCRAPE_CACHE_TTL)
+_url_cache = LRUCache(capacity=1000, ttl=_SCRAPE_CACHE_TTL)
+
+def _get_firecrawl_app() -> FirecrawlApp:
+    """Return a shared FirecrawlApp so its HTTP connections are reused"""
+    global _firecrawl_app
+    if _firecrawl_app is None:
+        _firecrawl_app = FirecrawlApp(api_key=os.getenv("FIRECRAWL_API_KEY"))
+    return _firecrawl_app
+
+# Upper bound on scraped content sent to the summary prompt
+_MAX_SCRAPED_CHARS = 6000
+
+def _format_scraped_data(scraped_data: Any) -> str:
+    """Prefer the page markdown over the full JSON payload, and cap its length"""
+    if isinstance(scraped_data, dict) and scraped_data.get("markdown"):
+        content = scraped_data["markdown"]
+    else:
+        content = json.dumps(scraped_data, separators=(',', ':'), default=str)
+    return content[:_MAX_SCRAPED_CHARS]
+
+# Prefixes of the text get_company_analysis returns when it could not summarize a company
+_FAILED_ANALYSIS_PREFIXES = ("Could not retrieve information for", "Could not find information for", "Error:")
+
+def is_failed_analysis(overview: Optional[str]) -> bool:
+    """True if overview is one of get_company_analysis' failure fallbacks rather than a summary"""
+    overview = (overview or "").strip()
+    # A failed scrape returns just the URL, which has no spaces
+    return not overview or overview.startswith(_FAILED_ANALYSIS_PREFIXES) or " " not in overview
+
 def get_company_analysis(deal_name: str) -> str:
     try:
-        app = FirecrawlApp(api_key=os.getenv("FIRECRAWL_API_KEY"))
-
-        company_name = ask_openai(
-            user_content=company_name_prompt.format(call_title=deal_name),
-            system_content="You are a smart financial analyst"
-        )
-        company_name = company_name.strip()
-        url = ask_openai(
-            system_content=f"You are a smart financial analyst",
-            user_content=f"""
-                What is the full website URL associated with the company name: "{company_name}".
-                INSTRUCTIONS:
-                - Ignore suffixes after a hyphen, like "New Deal", "New Opp" etc.
-                - Only return the main URL (home page) of the company. Skip any subdomains.
-                - If you cannot return a URL, return "None"
-            """
-        )
-        if url == "None":
+        app = _get_firecrawl_app()
+
+        # Memoized, so deals already seen by the sync don't cost another LLM call
+        company_name = extract_company_name(deal_name).strip()
+        url = _url_cache.get(company_name)
+        if url is None:
+            url = ask_openai(
+                system_content=f"You are a smart financial analyst",
+                user_content=f"""
+                    What is the full website URL associated with the company name: "{company_name}".
+                    INSTRUCTIONS:
+                    - Ignore suffixes after a hyphen, like "New Deal", "New Opp" etc.
+                    - Only return the main URL (home page) of the company. Skip any subdomains.
+                    - If you cannot return a URL, return "None"
+                """
+            ).strip()
+            # Only cache real URLs; "None" and LLM errors are retried on the next run
+            if url != "None" and not url.startswith("Error:"):
+                _url_cache.put(company_name, url)
+        if url == "None" or url.startswith("Error:"):
             print(Fore.YELLOW + f"Could not find URL for company: {company_name}" + Style.RESET_ALL)
             return f"Could not retrieve information for {company_name}."
 
         print(Fore.GREEN + f"Scraping URL: {url}" + Style.RESET_ALL)
         try:
-            scraped_data = app.scrape_url(
-                url, 
-                params={
-                    'onlyMainContent': True
-                }, 
-            )
-            formatted_crawl_result = json.dumps(scraped_data, indent=4)
+            scrape_key = (url, "onlyMainContent")
+            scraped_data = _scrape_cache.get(scrape_key)
+            if scraped_data is None:
+                scraped_data = app.scrape_url(
+                    url, 
+                    params={
+                        'onlyMainContent': True
+                    }, 
+                )
+                _scrape_cache.put(scrape_key, scraped_data)
+            formatted_crawl_result = _format_scraped_data(scraped_data)
             user_content = f"""
                 Your are given a company name and a scraped website data.
                 Your task is to analyze the website data and provide a summary of the company.
@@ -58,4 +105,14 @@ def get_company_analysis(deal_name: str) -> str:
 
     except Exception as e:
         print(Fore.RED + f"Error in company analysis: {str(e)}" + Style.RESET_ALL)
-        return f"Could not find information for {deal_name}."
\ No newline at end of file
+        return f"Could not find information for {deal_name}."
+
+def get_company_analyses(company_names: List[str]) -> Dict[str, str]:
+    """Run get_company_analysis for several companies in parallel, keyed by company name.
+    Each analysis is still a sequential name -> URL -> scrape -> summary chain."""
+    analyses = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=COMPANY_ANALYSIS_MAX_WORKERS) as executor:
+        future_to_name = {executor.submit(get_company_analysis, name): name for name in set(company_names)}
+        for future in concurrent.futures.as_completed(future_to_name):
+            analyses[future_to_name[future]] = future.result()
+    return analyses
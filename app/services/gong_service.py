@@ -1,17 +1,15 @@
-import sys
-import os
 from pathlib import Path
-
-# Add the project root directory to Python path
-project_root = str(Path(__file__).parent.parent.parent)
-if project_root not in sys.path:
-    sys.path.append(project_root)
-
-from colorama import Fore, Style, init
 import requests
-import json
+import concurrent.futures
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import logging
+import orjson
+import copy
+import threading
+import time
 from datetime import datetime, timedelta, timezone
-from collections import OrderedDict
+from functools import lru_cache
 from dataclasses import dataclass
 from typing import Dict, List, Tuple, Any
 from app.services.llm_service import ask_openai, ask_anthropic
@@ -23,7 +21,7 @@ from app.utils.prompts import champion_prompt, parr_principle_prompt, buyer_inte
 _call_pulse_prompt_path = Path(__file__).parent.parent / "prompts" / "call_pulse_prompt.txt"
 with open(_call_pulse_prompt_path, "r") as f:
     call_pulse_prompt = f.read()
-from app.utils.general_utils import extract_company_name
+from app.utils.general_utils import extract_company_name, content_hash, date_range_strs, format_iso_date, parse_iso_date
 
 import uuid
 import re
@@ -42,7 +40,91 @@ try:
 except LookupError:
     nltk.download('stopwords')
 
-init()
+logger = logging.getLogger(__name__)
+
+# Markdown fences and newlines the LLM wraps around JSON answers, plus Python-style booleans
+_LLM_CLEAN_RE = re.compile(r'```(?:json)?|\n|\bTrue\b|\bFalse\b')
+_LLM_CLEAN_REPLACEMENTS = {'True': 'true', 'False': 'false'}
+# Punctuation stripped from titles/company names before tokenizing
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+
+def _shrink_transcript(text: str, max_chars: int = None) -> str:
+    """Keep the head and tail of an overlong transcript so LLM prompts stay bounded."""
+    max_chars = max_chars or settings.GONG_TRANSCRIPT_MAX_CHARS
+    if len(text) <= max_chars:
+        return text
+    half = max_chars // 2
+    return text[:half] + "\n...[truncated]...\n" + text[-half:]
+
+def _extract_json_blob(text: str) -> str | None:
+    """Return the first balanced {...} object in text, or None.
+
+    A single linear scan that tracks brace depth and skips over string literals,
+    used when an LLM wraps its JSON answer in prose or code fences.
+    """
+    start = text.find('{')
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+def _parse_json_response(text: str) -> Any:
+    """Parse an LLM answer as JSON, falling back to the first embedded JSON object."""
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        blob = _extract_json_blob(text)
+        if blob is None:
+            raise
+        return orjson.loads(blob)
+
+def _clean_llm_json(text: str) -> Any:
+    """Parse an LLM response as JSON, stripping code fences/newlines only if needed."""
+    # Most responses are already clean JSON; skip the sanitizing pass for those
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        pass
+
+    text = _LLM_CLEAN_RE.sub(lambda m: _LLM_CLEAN_REPLACEMENTS.get(m.group(0), ''), text).strip()
+    # Some responses start with a bare "json" language tag and no fence
+    return orjson.loads(text.removeprefix('json'))
+
+def _call_utc_date(call: Dict) -> str | None:
+    """UTC YYYY-MM-DD a Gong call started (or was scheduled) on, or None if it has no usable timestamp."""
+    for field in ("started", "scheduled", "startTime"):
+        value = call.get(field)
+        if not value:
+            continue
+        try:
+            start = parse_iso_date(value)
+        except (TypeError, ValueError):
+            continue
+        # Offset-less timestamps are already UTC
+        if start.tzinfo is not None:
+            start = start.astimezone(timezone.utc)
+        return format_iso_date(start)
+    return None
 
 def parse_markdown_buyer_intent(markdown_text: str, intent: str = "Likely to buy") -> Dict:
     """
@@ -102,26 +184,15 @@ def parse_markdown_buyer_intent(markdown_text: str, intent: str = "Likely to buy
         }
         
     except Exception as e:
-        print(f"Error parsing markdown buyer intent: {str(e)}")
+        logger.error("Error parsing markdown buyer intent: %s", e)
         return {
             "intent": "Unable to determine",
             "summary": {"Parsing Error": [f"Could not parse markdown response: {str(e)}"]}
         }
 
-def filter_filler_words(text: str) -> set:
-    """
-    Filter out filler words, special characters, and noisy words from text.
-    Returns a set of meaningful words.
-    """
-    if not text:
-        return set()
-    
-    # Remove special characters and convert to lowercase
-    text = re.sub(r'[^\w\s]', ' ', text.lower())
-    
-    # Tokenize the text
-    tokens = word_tokenize(text)
-    
+@lru_cache(maxsize=None)
+def _noise_words() -> frozenset:
+    """Stopwords plus custom noise, built once (stopwords.words reads from disk)."""
     # Get English stopwords
     stop_words = set(stopwords.words('english'))
     
@@ -163,7 +234,23 @@ def filter_filler_words(text: str) -> set:
     }
         
     # Combine stopwords with custom noise
-    all_noise = stop_words.union(custom_noise)
+    return frozenset(stop_words.union(custom_noise))
+
+def filter_filler_words(text: str) -> set:
+    """
+    Filter out filler words, special characters, and noisy words from text.
+    Returns a set of meaningful words.
+    """
+    if not text:
+        return set()
+    
+    # Remove special characters and convert to lowercase
+    text = _NON_WORD_RE.sub(' ', text.lower())
+    
+    # Tokenize the text
+    tokens = word_tokenize(text)
+    
+    all_noise = _noise_words()
     
     # Filter out noise words and short words (less than 2 characters)
     meaningful_words = {
@@ -192,36 +279,173 @@ class Speaker:
             "full_transcript": self.full_transcript
         }
 
+# Days and calls fetched in parallel by get_speaker_data and get_concerns
+DAY_FETCH_MAX_WORKERS = 8
+# Concurrent champion/PARR LLM requests in get_champions (kept low for rate limits)
+CHAMPION_LLM_MAX_WORKERS = settings.GONG_LLM_CONCURRENCY
+# Speakers with less transcript than this are skipped in get_champions
+CHAMPION_MIN_TRANSCRIPT_CHARS = 200
+
+# (connect, read) timeout for every Gong request, so a hung connection can't block a worker forever
+GONG_HTTP_TIMEOUT = (3.05, 30)
+
+_shared_session = None
+
+def get_shared_session() -> requests.Session:
+    """Process-wide pooled session for Gong, shared by every GongService instance"""
+    global _shared_session
+    if _shared_session is None:
+        session = requests.Session()
+        session.auth = (settings.GONG_ACCESS_KEY, settings.GONG_CLIENT_SECRET)
+        session.headers.update({"Content-Type": "application/json"})
+        # Gong's POST endpoints used here are read-only queries, so they're safe to retry
+        retries = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(["GET", "POST"]),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=retries)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _shared_session = session
+    return _shared_session
+
+def close_shared_session() -> None:
+    """Close the shared Gong session (called on application shutdown)"""
+    global _shared_session
+    if _shared_session is not None:
+        _shared_session.close()
+        _shared_session = None
+
+class LRUCache:
+    """Thread-safe LRU cache whose entries expire after ttl seconds.
+
+    Entries are stored as (value, expiry) tuples in a plain dict, which keeps
+    insertion order; a hit is re-inserted so the oldest entry is always first.
+    """
+
+    def __init__(self, capacity: int, ttl: int):
+        self.capacity = capacity
+        self.ttl = ttl
+        self.cache = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self.cache.pop(key, None)
+            if entry is None:
+                return None
+            value, expiry = entry
+            if expiry < time.monotonic():
+                return None
+            self.cache[key] = entry
+            return value
+
+    def put(self, key, value, ttl: int = None) -> None:
+        """Store value; ttl overrides the cache-wide TTL for this entry"""
+        with self._lock:
+            self.cache.pop(key, None)
+            self.cache[key] = (value, time.monotonic() + (self.ttl if ttl is None else ttl))
+            if len(self.cache) > self.capacity:
+                del self.cache[next(iter(self.cache))]
+
+    def keys(self) -> list:
+        """Snapshot of the cached keys (may include expired entries), safe to iterate while other threads write"""
+        with self._lock:
+            return list(self.cache)
+
+    def remove(self, key) -> None:
+        with self._lock:
+            self.cache.pop(key, None)
+
+# Shared across GongService instances, like the session, so cache clears are visible everywhere
+_champion_cache = LRUCache(capacity=1000, ttl=3600)
+# Raw Gong responses (list_calls, transcripts); short TTL since calls keep landing during the day
+_http_cache = LRUCache(capacity=512, ttl=300)
+# LLM answers keyed by prompt kind + prompt hash, so identical transcripts aren't re-analyzed
+_llm_cache = LRUCache(capacity=2048, ttl=86400)
+# Final get_concerns results per (company, date)
+_concerns_cache = LRUCache(capacity=1000, ttl=3600)
+# get_meeting_insights results per call id; calls from earlier days are final and kept longer
+_insights_cache = LRUCache(capacity=512, ttl=300)
+INSIGHTS_PAST_CALL_TTL = 86400
+
 class GongService:
-    def __init__(self):
+    def __init__(self, session: requests.Session = None):
         self.access_key = settings.GONG_ACCESS_KEY
         self.client_secret = settings.GONG_CLIENT_SECRET
         self.reschedule_window = 1
 
+        # Reuse connections across Gong calls and across GongService instances
+        self._session = session or get_shared_session()
+        self.champion_cache = _champion_cache
+        self.http_cache = _http_cache
+        self.llm_cache = _llm_cache
+        self.concerns_cache = _concerns_cache
+        self.insights_cache = _insights_cache
+
+    def _cached_ask(self, prompt_kind: str, user_content: str, system_content: str = None,
+                    provider: str = "openai", json_mode: bool = False) -> str:
+        """ask_openai (or ask_anthropic), memoized on the provider and prompt contents.
+        json_mode requests OpenAI's JSON-object output and is ignored for Anthropic."""
+        key = (prompt_kind, content_hash([provider, json_mode, user_content, system_content]))
+        response = self.llm_cache.get(key)
+        if response is None:
+            kwargs = {"user_content": user_content}
+            if system_content is not None:
+                kwargs["system_content"] = system_content
+            if provider == "anthropic":
+                response = ask_anthropic(**kwargs)
+            else:
+                response = ask_openai(json_mode=json_mode, **kwargs)
+            # LLM errors are returned as-is but never cached, so the next call retries
+            if not response.startswith("Error:"):
+                self.llm_cache.put(key, response)
+        return response
+
+    def _post_json(self, url: str, payload: Dict) -> Dict | None:
+        """POST a Gong query, encoding the payload and parsing the (often multi-MB) body with orjson.
+        Returns None when Gong responds with an error.
+        """
+        # The shared session already sends Content-Type: application/json
+        response = self._session.post(url, data=orjson.dumps(payload), timeout=GONG_HTTP_TIMEOUT)
+        if not response.ok:
+            return None
+        return orjson.loads(response.content)
 
     def list_calls(self, call_date) -> List[Dict]:
+        return self.list_calls_between(f"{call_date}T00:00:00Z", f"{call_date}T23:59:59Z")
+
+    def list_calls_between(self, from_datetime: str, to_datetime: str, include_attendees: bool = True) -> List[Dict]:
+        """List calls in [from_datetime, to_datetime], optionally with their attendees.
+
+        Attendees cost one extra request per call, so callers that only match on
+        titles should pass include_attendees=False.
+        """
         url = "https://us-5738.api.gong.io/v2/calls"
 
-        # Format date strings for API
-        from_datetime = f"{call_date}T00:00:00Z"
-        to_datetime = f"{call_date}T23:59:59Z"
+        cache_key = ('list_calls', from_datetime, to_datetime, include_attendees)
+        cached = self.http_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
 
         params = {
             "fromDateTime": from_datetime,
             "toDateTime": to_datetime
         }
         
-        response = requests.get(url, auth=(self.access_key, self.client_secret), params=params)
+        response = self._session.get(url, params=params, timeout=GONG_HTTP_TIMEOUT)
         if response.ok:
-            calls = response.json().get("calls", [])
+            calls = orjson.loads(response.content).get("calls", [])
             
             # Get detailed information for each call including attendees
-            for call in calls:
+            for call in (calls if include_attendees else []):
                 call_id = call.get("id")
                 if call_id:
                     # Get extensive call data
                     extensive_url = "https://us-5738.api.gong.io/v2/calls/extensive"
-                    headers = {'Content-Type': 'application/json'}
                     extensive_payload = {
                         "filter": {
                             "callIds": [str(call_id)]
@@ -236,15 +460,9 @@ class GongService:
                         }
                     }
                     
-                    extensive_response = requests.post(
-                        extensive_url,
-                        auth=(self.access_key, self.client_secret),
-                        headers=headers,
-                        json=extensive_payload
-                    )
+                    call_data = self._post_json(extensive_url, extensive_payload)
                     
-                    if extensive_response.ok:
-                        call_data = extensive_response.json()
+                    if call_data is not None:
                         calls_data = call_data.get("calls", [])
                         if calls_data:
                             # Add attendee information to the call object
@@ -257,6 +475,7 @@ class GongService:
                                 }
                                 call["attendees"].append(attendee)
             
+            self.http_cache.put(cache_key, copy.deepcopy(calls))
             return calls
         else:
             return []
@@ -282,7 +501,10 @@ class GongService:
         
         company_synonyms = company_name.split(",")
 
-        print(f"Company synonyms: {company_synonyms}")
+        logger.debug("Company synonyms: %s", company_synonyms)
+
+        # Tokenize each synonym once rather than once per call
+        synonym_token_sets = [filter_filler_words(synonym.strip()) for synonym in company_synonyms]
 
         for gong_call in calls_from_gong:
             
@@ -290,20 +512,19 @@ class GongService:
             # Filter out filler words from title
             title_words = filter_filler_words(title)
 
-            for synonym in company_synonyms:
-                synonym = synonym.strip()
-                # Filter out filler words from synonym
-                synonym_tokens = filter_filler_words(synonym)
-
-                # Check if any meaningful tokens from synonym are present in title words
-                if synonym_tokens & title_words:
-                    return str(gong_call["id"])
+            # Check if any meaningful tokens from a synonym are present in title words
+            if any(not synonym_tokens.isdisjoint(title_words) for synonym_tokens in synonym_token_sets):
+                return str(gong_call["id"])
         
         return None
 
     def get_call_transcripts(self, call_ids, from_date, to_date) -> Dict[str, Any] | None:
         url = 'https://us-5738.api.gong.io/v2/calls/transcript'
-        headers = {'Content-Type': 'application/json'}
+        cache_key = ('transcripts', from_date, to_date, tuple(sorted(str(cid) for cid in call_ids)))
+        cached = self.http_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
         payload = {
             "filter": {
                 "fromDateTime": from_date,
@@ -312,13 +533,39 @@ class GongService:
             }
         }
 
-        response = requests.post(url, auth=(self.access_key, self.client_secret), headers=headers, json=payload)
+        transcripts = self._post_json(url, payload)
 
-        if response.ok:
-            return response.json()
+        if transcripts is not None:
+            self.http_cache.put(cache_key, copy.deepcopy(transcripts))
+            return transcripts
         else:
             return None
 
+    def _concerns_transcript_for_date(self, date_str: str, company_name: str, call_title: str) -> str:
+        """Non-Galileo transcript of the matching call on date_str, or "" if there is none"""
+        # Only titles are needed to find the call, so skip the per-call attendee lookups
+        calls = self.list_calls_between(f"{date_str}T00:00:00Z", f"{date_str}T23:59:59Z", include_attendees=False)
+        call_id = self.get_call_id(calls, company_name, call_title=call_title)
+        if not call_id:
+            return ""
+
+        transcripts_data = self.get_call_transcripts([call_id], f"{date_str}T00:00:00Z", f"{date_str}T23:59:59Z")
+        if not transcripts_data or "callTranscripts" not in transcripts_data:
+            return ""
+
+        transcript_parts = []
+        for transcript in transcripts_data["callTranscripts"]:
+            for part in transcript.get("transcript", []):
+                speaker_id = part.get("speakerId", "unknown")
+                # Skip Galileo speakers
+                if "galileo.ai" in speaker_id.lower():
+                    continue
+
+                for sentence in part.get("sentences", []):
+                    transcript_parts.append(sentence.get("text", "") + " ")
+
+        return "".join(transcript_parts)
+
     def get_concerns(self, call_title: str, call_date: str) -> Dict[str, Any]:
         """Analyze call transcripts for potential concerns using multiple prompts."""
 
@@ -336,75 +583,63 @@ class GongService:
                 target_date = datetime.strptime(call_date, "%Y-%m-%d")
             else:
                 target_date = call_date
+
+            cache_key = (company_name.lower(), format_iso_date(target_date))
+            cached = self.concerns_cache.get(cache_key)
+            if cached is not None:
+                return copy.deepcopy(cached)
             
             start_date = target_date
             end_date = target_date + timedelta(days=self.reschedule_window)
 
+            date_strs = date_range_strs(start_date, end_date)
+
+            # Look up each day's call transcript in parallel
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(DAY_FETCH_MAX_WORKERS, len(date_strs))) as executor:
+                transcripts = list(executor.map(
+                    lambda date_str: self._concerns_transcript_for_date(date_str, company_name, call_title),
+                    date_strs
+                ))
+
+            # Only the most recent analyzable call is reported, so only that one goes to the LLM
             all_results = []
-            current_date = start_date
-            
-            while current_date <= end_date:
-                date_str = current_date.strftime("%Y-%m-%d")
-                
-                calls = self.list_calls(date_str)
-                call_id = self.get_call_id(calls, company_name, call_title=call_title)
-                
-                if call_id:
-                    start_time = f"{date_str}T00:00:00Z"
-                    end_time = f"{date_str}T23:59:59Z"
-                    transcripts_data = self.get_call_transcripts([call_id], start_time, end_time)
-
-                    if transcripts_data and "callTranscripts" in transcripts_data:
-                        combined_transcript = ""
-                        for transcript in transcripts_data["callTranscripts"]:
-                            for part in transcript.get("transcript", []):
-                                speaker_id = part.get("speakerId", "unknown")
-                                # Skip Galileo speakers
-                                if "galileo.ai" in speaker_id.lower():
-                                    continue
-                                
-                                if "sentences" in part:
-                                    for sentence in part["sentences"]:
-                                        combined_transcript += sentence.get("text", "") + " "
-
-                        if combined_transcript.strip():
-                            pricing_response = ask_openai(
-                                user_content=pricing_concerns_prompt.format(transcript=combined_transcript)
-                            )
-
-                            pr_json = json.loads(pricing_response)
-
-                            decision_maker_response = ask_openai(
-                                user_content=no_decision_maker_prompt.format(transcript=combined_transcript)
-                            )
-
-                            dm_json = json.loads(decision_maker_response)
-
-                            vendor_response = ask_openai(
-                                user_content=already_has_vendor_prompt.format(transcript=combined_transcript)
-                            )
-
-                            vr_json = json.loads(vendor_response)
-
-                            all_results.append({
-                                "date": date_str,
-                                "result": {
-                                    "pricing_concerns": {
-                                        "has_concerns": pr_json.get("pricing_concerns", False),
-                                        "explanation": pr_json.get("explanation", "-- Not computed --")
-                                    },
-                                    "no_decision_maker": {
-                                        "is_issue": dm_json.get("no_decision_maker", False),
-                                        "explanation": dm_json.get("explanation", "-- Not computed --")
-                                    },
-                                    "already_has_vendor": {
-                                        "has_vendor": vr_json.get("already_has_vendor", False),
-                                        "explanation": vr_json.get("explanation", "-- Not computed --")
-                                    }
-                                }
-                            })
-            
-                current_date += timedelta(days=1)
+            for date_str, combined_transcript in reversed(list(zip(date_strs, transcripts))):
+                if not combined_transcript.strip():
+                    continue
+
+                # The three concern prompts are independent, so run them concurrently
+                with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+                    pricing_future, decision_maker_future, vendor_future = [
+                        executor.submit(self._cached_ask, prompt_kind, user_content=prompt.format(transcript=combined_transcript), json_mode=True)
+                        for prompt_kind, prompt in (
+                            ("pricing_concerns", pricing_concerns_prompt),
+                            ("no_decision_maker", no_decision_maker_prompt),
+                            ("already_has_vendor", already_has_vendor_prompt)
+                        )
+                    ]
+
+                    pr_json = _parse_json_response(pricing_future.result())
+                    dm_json = _parse_json_response(decision_maker_future.result())
+                    vr_json = _parse_json_response(vendor_future.result())
+
+                all_results.append({
+                    "date": date_str,
+                    "result": {
+                        "pricing_concerns": {
+                            "has_concerns": pr_json.get("pricing_concerns", False),
+                            "explanation": pr_json.get("explanation", "-- Not computed --")
+                        },
+                        "no_decision_maker": {
+                            "is_issue": dm_json.get("no_decision_maker", False),
+                            "explanation": dm_json.get("explanation", "-- Not computed --")
+                        },
+                        "already_has_vendor": {
+                            "has_vendor": vr_json.get("already_has_vendor", False),
+                            "explanation": vr_json.get("explanation", "-- Not computed --")
+                        }
+                    }
+                })
+                break
 
             if not all_results:
                 return {
@@ -415,11 +650,11 @@ class GongService:
 
             # Return the most recent result if multiple calls found
             latest_result = all_results[-1]["result"]
+            self.concerns_cache.put(cache_key, copy.deepcopy(latest_result))
             return latest_result
 
         except Exception as e:
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error getting concerns for call %s on %s", call_title, call_date)
             return {
                 "pricing_concerns": {"has_concerns": False, "explanation": f"Error: {str(e)}"},
                 "no_decision_maker": {"is_issue": False, "explanation": f"Error: {str(e)}"},
@@ -428,25 +663,29 @@ class GongService:
 
     def get_buyer_intent_json(self, call_transcript, seller_name) -> Dict:
         try:
-            print("Getting buyer intent.")
-            response = ask_anthropic(
+            logger.info("Getting buyer intent.")
+            response = self._cached_ask(
+                "buyer_intent",
                 user_content=buyer_intent_prompt.format(
-                    call_transcript=call_transcript,
+                    call_transcript=_shrink_transcript(call_transcript),
                     seller_name=seller_name
                 ),
-                system_content="You are a smart Sales Analyst that analyzes Sales calls."
+                system_content="You are a smart Sales Analyst that analyzes Sales calls.",
+                provider="anthropic"
             )
+            if response.startswith("Error:"):
+                raise ValueError(response)
 
             # First, try to parse as JSON (in case LLM returns proper JSON)
             try:
-                intent_json = json.loads(response)
+                intent_json = _parse_json_response(response)
                 
                 # Check if the summary is a string that needs to be parsed as markdown
                 if isinstance(intent_json.get("summary"), str) and intent_json["summary"].startswith("##"):
                     structured_summary = parse_markdown_buyer_intent(intent_json["summary"], intent_json.get("intent", "Likely to buy"))
                     intent_json["summary"] = structured_summary["summary"]
 
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 
                 # Try to extract intent from the response
                 intent = "Likely to buy"  # Default intent
@@ -470,9 +709,9 @@ class GongService:
                 intent_json["summary"] = "No explanation provided"
             # Debug: Print the structure if it's a dictionary
             if isinstance(intent_json.get("summary"), dict):
-                print(f"✅ Successfully structured buyer intent with sections: {list(intent_json['summary'].keys())}")
+                logger.debug("Structured buyer intent with sections: %s", list(intent_json['summary']))
             else:
-                print(f"⚠️ WARNING: intent_json summary is type {type(intent_json.get('summary'))}, not dict!")
+                logger.warning("intent_json summary is type %s, not dict", type(intent_json.get('summary')))
 
             return intent_json
         except Exception as e:
@@ -484,7 +723,7 @@ class GongService:
 
     def get_transcript_and_topics(self, call_id, start_time, end_time) -> Tuple[str, List[str]]:
         """Get transcript and topics for a call"""
-        full_transcript = ""
+        transcript_parts = []
         topics = []
         call_transcripts = self.get_call_transcripts([call_id], start_time, end_time)
 
@@ -495,16 +734,16 @@ class GongService:
                         topics.append(tx["topic"])
                     if "sentences" in tx:
                         for sentence in tx["sentences"]:
-                            full_transcript += sentence["text"] + " "
+                            transcript_parts.append(sentence["text"] + " ")
         
-        return full_transcript, topics
+        return "".join(transcript_parts), topics
 
     def get_buyer_intent(self, call_title, call_date, seller_name):
         
         try:
             company_name = extract_company_name(call_title)
             if isinstance(call_date, datetime):
-                call_date = call_date.strftime("%Y-%m-%d")
+                call_date = format_iso_date(call_date)
             
             # Default response if no call found
             default_response = {
@@ -512,25 +751,31 @@ class GongService:
                 "summary": f"No call found on {call_date}"
             }
 
-            calls_from_gong = self.list_calls(call_date)
-            call_id = self.get_call_id(calls_from_gong, company_name, call_title)
+            # Fetch the call date and the next day in one request; only titles are needed here
+            next_date = format_iso_date(datetime.strptime(call_date, "%Y-%m-%d") + timedelta(days=1))
+            calls_from_gong = self.list_calls_between(
+                f"{call_date}T00:00:00Z", f"{next_date}T23:59:59Z", include_attendees=False
+            )
+            calls_by_date = {}
+            for call in calls_from_gong:
+                calls_by_date.setdefault(_call_utc_date(call), []).append(call)
+            call_id = self.get_call_id(calls_by_date.get(call_date, []), company_name, call_title)
 
             if not call_id:
                 # Try the next day
-                try:
-                    call_date = datetime.strptime(call_date, "%Y-%m-%d") + timedelta(days=1)
-                    call_date = call_date.strftime("%Y-%m-%d")
-                    
-                    calls_from_gong = self.list_calls(call_date) # call again, for the next day
+                call_id = self.get_call_id(calls_by_date.get(next_date, []), company_name, call_title)
+                if call_id:
+                    call_date = next_date
 
-                    if not calls_from_gong or len(calls_from_gong) == 0:
-                        return default_response
-                        
-                    call_id = self.get_call_id(calls_from_gong, company_name, call_title)
-                    if not call_id:
-                        return default_response
-                except Exception as e:
-                    return default_response
+            if not call_id and None in calls_by_date:
+                # Some calls have no usable timestamp; match against everything and
+                # take the transcript window from whichever call matched
+                call_id = self.get_call_id(calls_from_gong, company_name, call_title)
+                matched = next((call for call in calls_from_gong if str(call.get("id")) == call_id), None)
+                call_date = (matched and _call_utc_date(matched)) or call_date
+
+            if not call_id:
+                return default_response
 
             if call_id:
                 start_time = f"{call_date}T00:00:00Z"
@@ -554,151 +799,144 @@ class GongService:
                 "summary": f"Error analyzing call: {str(e)}"
             }
 
-    def get_speaker_data(self, company_name: str, start_date: datetime, end_date: datetime) -> Dict[str, Speaker]:
-        """Populate speaker data from Gong API calls within the given date range."""
-        speaker_data: Dict[str, Speaker] = {}
+    def _fetch_day_matching_calls(self, date_str: str, company_name_tokens: set) -> List[Dict]:
+        """Return the (up to 10) calls on date_str whose titles match the company, oldest first"""
+        # Goes through the response cache shared with get_concerns' per-day lookups
+        calls = self.list_calls_between(f"{date_str}T00:00:00Z", f"{date_str}T23:59:59Z", include_attendees=False)
+
+        # Loop through all the calls and match the title
+        matching_calls = [
+            call for call in calls
+            if not company_name_tokens.isdisjoint(filter_filler_words(call.get("title", "")))
+        ]
+
+        # sort the matching calls by date; ISO-8601 strings already sort chronologically,
+        # so no datetime parsing is needed (a null startTime sorts first instead of raising)
+        matching_calls.sort(key=lambda x: x.get("startTime") or "")
+        return matching_calls[:10]
+
+    def _fetch_call_bundles(self, call_ids: List[str], from_datetime: str, to_datetime: str) -> List[Tuple[Dict[str, Tuple[str, str, str]], List[Tuple[str, List[str]]]]]:
+        """Fetch speaker mappings and transcripts for several calls with one request each,
+        returning (speaker_info, [(speaker_id, sentence texts), ...]) per call in call_ids order.
+        Only the sentence texts are kept, so the raw transcript payload is freed on return."""
+        if not call_ids:
+            return []
+        call_ids = [str(call_id) for call_id in call_ids]
 
-        # Iterate through each day in the range
-        current_date = start_date
-        while current_date <= end_date:
-            date_str = current_date.strftime("%Y-%m-%d")
-            
-            # Get calls for this day
-            url = "https://us-5738.api.gong.io/v2/calls"
-            from_datetime = f"{date_str}T00:00:00Z"
-            to_datetime = f"{date_str}T23:59:59Z"
-            
-            params = {
+        # Get extensive call data for speaker information
+        extensive_url = "https://us-5738.api.gong.io/v2/calls/extensive"
+        extensive_payload = {
+            "filter": {
+                "callIds": call_ids
+            },
+            "contentSelector": {
+                "exposedFields": {
+                    "parties": True,
+                    "interaction": {
+                        "speakers": True
+                    }
+                }
+            }
+        }
+        
+        # Get transcripts for all calls
+        transcript_url = 'https://us-5738.api.gong.io/v2/calls/transcript'
+        transcript_payload = {
+            "filter": {
                 "fromDateTime": from_datetime,
-                "toDateTime": to_datetime
+                "toDateTime": to_datetime,
+                "callIds": call_ids
             }
+        }
 
-            response = requests.get(
-                url, 
-                auth=(self.access_key, self.client_secret), 
-                params=params
-            )
-            
-            if not response.ok:
-                current_date += timedelta(days=1)
-                continue
-                
-            calls = response.json().get("calls", [])
-
-            # Loop through all the calls and match the title
-            matching_calls = []
-            matches = 0
-            for call in calls:
-                title = call.get("title", "")
-
-                # Filter out filler words from company name and title
-                company_name_tokens = filter_filler_words(company_name)
-                title_tokens = filter_filler_words(title)
+        # The two requests are independent, so fetch the speakers in the background
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            extensive_future = executor.submit(self._post_json, extensive_url, extensive_payload)
+            transcript_data = self._post_json(transcript_url, transcript_payload)
+            extensive_data = extensive_future.result()
+        
+        if extensive_data is None or transcript_data is None:
+            return []
+        
+        speaker_info_by_call = {}
+        for call_data in extensive_data.get("calls", []):
+            call_id = str(call_data.get("metaData", {}).get("id", ""))
+            speaker_info = speaker_info_by_call.setdefault(call_id, {})
+
+            # Extract party information (speakers)
+            for party in call_data.get("parties", []):
+                speaker_id = party.get("speakerId")
+                if speaker_id:
+                    # (name, email, affiliation)
+                    speaker_info[speaker_id] = (
+                        party.get("name", "Unknown"),
+                        party.get("emailAddress", ""),
+                        party.get("affiliation", "Unknown")
+                    )
 
-                if company_name_tokens & title_tokens:
-                    matching_calls.append(call)
-                    matches += 1
+        transcripts_by_call = {}
+        for transcript in transcript_data.get("callTranscripts", []):
+            speaker_parts = transcripts_by_call.setdefault(str(transcript.get("callId", "")), [])
+            for part in transcript.get("transcript", []):
+                speaker_parts.append((
+                    part.get("speakerId", "unknown"),
+                    [sentence.get("text", "") for sentence in part.get("sentences", [])]
+                ))
 
-            # sort the matching calls by date
-            matching_calls.sort(key=lambda x: x.get("startTime", ""))
+        return [
+            (speaker_info_by_call.get(call_id, {}), transcripts_by_call.get(call_id, []))
+            for call_id in call_ids
+        ]
 
-            # Process each matching call (latest 10 calls)
-            for call in matching_calls[:10]:
-                call_id = call.get("id")
-                
-                # Get extensive call data for speaker information
-                extensive_url = "https://us-5738.api.gong.io/v2/calls/extensive"
-                headers = {'Content-Type': 'application/json'}
-                extensive_payload = {
-                    "filter": {
-                        "callIds": [str(call_id)]
-                    },
-                    "contentSelector": {
-                        "exposedFields": {
-                            "parties": True,
-                            "interaction": {
-                                "speakers": True
-                            }
-                        }
-                    }
-                }
-                
-                extensive_response = requests.post(
-                    extensive_url,
-                    auth=(self.access_key, self.client_secret),
-                    headers=headers,
-                    json=extensive_payload
+    def get_speaker_data(self, company_name: str, start_date: datetime, end_date: datetime) -> Dict[str, Speaker]:
+        """Populate speaker data from Gong API calls within the given date range.
+        Days and calls are fetched concurrently; results are merged in date and call order."""
+        speaker_data: Dict[str, Speaker] = {}
+        company_name_tokens = filter_filler_words(company_name)
+
+        date_strs = date_range_strs(start_date, end_date)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=DAY_FETCH_MAX_WORKERS) as executor:
+            # Get calls for each day
+            day_futures = [
+                executor.submit(self._fetch_day_matching_calls, date_str, company_name_tokens)
+                for date_str in date_strs
+            ]
+
+            # Then the speakers and transcripts of each day's matching calls, one batch per day
+            bundle_futures = [
+                executor.submit(
+                    self._fetch_call_bundles,
+                    [call.get("id") for call in day_future.result()],
+                    f"{date_str}T00:00:00Z",
+                    f"{date_str}T23:59:59Z"
                 )
+                for date_str, day_future in zip(date_strs, day_futures)
+            ]
+
+            bundles = [bundle for future in bundle_futures for bundle in future.result()]
+
+        transcript_parts: Dict[str, List[str]] = {}
+        for speaker_info, speaker_parts in bundles:
+            # Process all transcripts
+            for speaker_id, sentences in speaker_parts:
+                # Create the speaker object from our mapping the first time we see them
+                if speaker_id not in speaker_data:
+                    speaker_name, speaker_email, speaker_affiliation = speaker_info.get(
+                        speaker_id, ("Unknown Speaker", "", "Unknown")
+                    )
+                    speaker_data[speaker_id] = Speaker(
+                        speaker_id=speaker_id,
+                        speaker_name=speaker_name,
+                        email=speaker_email,
+                        affiliation=speaker_affiliation
+                    )
                 
-                if not extensive_response.ok:
-                    continue
-                
-                speaker_info = {}
-                extensive_data = extensive_response.json()
-                calls_data = extensive_data.get("calls", [])
-                
-                for call_data in calls_data:
-                    # Extract party information (speakers)
-                    parties = call_data.get("parties", [])
-                    
-                    for party in parties:
-                        speaker_id = party.get("speakerId")
-                        if speaker_id:
-                            speaker_info[speaker_id] = {
-                                "name": party.get("name", "Unknown"),
-                                "email": party.get("emailAddress", ""),
-                                "affiliation": party.get("affiliation", "Unknown")
-                            }
-                
-                # Get transcript for this call
-                transcript_url = 'https://us-5738.api.gong.io/v2/calls/transcript'
-                transcript_payload = {
-                    "filter": {
-                        "fromDateTime": from_datetime,
-                        "toDateTime": to_datetime,
-                        "callIds": [str(call_id)]
-                    }
-                }
+                # Collect sentences per speaker and join once at the end
+                transcript_parts.setdefault(speaker_id, []).extend(sentence + " " for sentence in sentences)
 
-                transcript_response = requests.post(
-                    transcript_url, 
-                    auth=(self.access_key, self.client_secret), 
-                    headers=headers, 
-                    json=transcript_payload
-                )
-                
-                if not transcript_response.ok:
-                    continue
-                    
-                transcript_data = transcript_response.json()
-                
-                # Process all transcripts
-                if "callTranscripts" in transcript_data:
-                    for transcript in transcript_data["callTranscripts"]:
-                        for part in transcript.get("transcript", []):
-                            speaker_id = part.get("speakerId", "unknown")
-                            
-                            # Get speaker details from our mapping
-                            details = speaker_info.get(speaker_id, {})
-                            speaker_name = details.get("name", "Unknown Speaker")
-                            speaker_email = details.get("email", "")
-                            speaker_affiliation = details.get("affiliation", "Unknown")
-                            
-                            # Create or update speaker object
-                            if speaker_id not in speaker_data:
-                                speaker_data[speaker_id] = Speaker(
-                                    speaker_id=speaker_id,
-                                    speaker_name=speaker_name,
-                                    email=speaker_email,
-                                    affiliation=speaker_affiliation
-                                )
-                            
-                            # Extract and concatenate all sentences from this speaker
-                            if "sentences" in part:
-                                for sentence in part["sentences"]:
-                                    speaker_data[speaker_id].full_transcript += sentence.get("text", "") + " "
-
-            current_date += timedelta(days=1)
+        for speaker_id, parts in transcript_parts.items():
+            speaker_data[speaker_id].full_transcript = "".join(parts)
         
         return speaker_data
 
@@ -708,6 +946,11 @@ class GongService:
 
             if target_date is None:
                 target_date = datetime.now()
+
+            cache_key = ("champions", company_name.lower(), format_iso_date(target_date))
+            cached = self.champion_cache.get(cache_key)
+            if cached is not None:
+                return copy.deepcopy(cached)
             
             start_date = target_date
             end_date = target_date + timedelta(days=self.reschedule_window)
@@ -721,43 +964,68 @@ class GongService:
             if len(speaker_transcripts) == 0:
                 return []
 
-            llm_responses = []
-            for speaker_transcript in speaker_transcripts[:8]:
-                if "galileo" not in speaker_transcript["email"].lower():
-
-                    transcript = speaker_transcript["full_transcript"]
+            # Only external speakers who said enough to analyze are worth an LLM call;
+            # filter before capping so internal speakers can't take the slots
+            external_speakers = [
+                speaker_transcript for speaker_transcript in speaker_transcripts
+                if "galileo" not in speaker_transcript["email"].lower()
+                and speaker_transcript["affiliation"] != "Internal"
+                and len(speaker_transcript["full_transcript"].strip()) >= CHAMPION_MIN_TRANSCRIPT_CHARS
+            ][:8]
+            system_content = "You are a smart Sales Operations Analyst that analyzes Sales calls."
+
+            # The champion and PARR prompts are independent, so fire both for every speaker at once
+            with concurrent.futures.ThreadPoolExecutor(max_workers=CHAMPION_LLM_MAX_WORKERS) as executor:
+                futures = []
+                # The champion prompt depends only on the transcript, so speakers with identical
+                # transcripts share one request (they'd otherwise race past llm_cache together)
+                champion_futures = {}
+                for speaker_transcript in external_speakers:
+                    transcript = _shrink_transcript(speaker_transcript["full_transcript"])
+                    champion_future = champion_futures.get(transcript)
+                    if champion_future is None:
+                        champion_future = champion_futures[transcript] = executor.submit(
+                            self._cached_ask,
+                            "champion",
+                            user_content=champion_prompt.format(transcript=transcript),
+                            system_content=system_content,
+                            json_mode=True
+                        )
+                    parr_future = executor.submit(
+                        self._cached_ask,
+                        "parr",
+                        user_content=parr_principle_prompt.format(speaker_name=speaker_transcript["speakerName"], transcript=transcript),
+                        system_content=system_content,
+                        json_mode=True
+                    )
+                    futures.append((speaker_transcript, champion_future, parr_future))
 
+                llm_responses = []
+                complete = True
+                for speaker_transcript, champion_future, parr_future in futures:
                     try:
-                        speaker_response = ask_openai(
-                            user_content=champion_prompt.format(transcript=transcript),
-                            system_content="You are a smart Sales Operations Analyst that analyzes Sales calls."
-                        ).replace('```json', '').replace('```', '').replace('\n', '').replace('True', 'true').replace('False', 'false').strip()
-                        speaker_response = json.loads(speaker_response)
+                        speaker_response = _clean_llm_json(champion_future.result())
                         speaker_response["email"] = speaker_transcript["email"]
                         speaker_response["speakerName"] = speaker_transcript["speakerName"]
-
-                        parr_response = ask_openai(
-                            user_content=parr_principle_prompt.format(speaker_name=speaker_transcript["speakerName"], transcript=transcript),
-                            system_content="You are a smart Sales Operations Analyst that analyzes Sales calls."
-                        ).replace('```json', '').replace('json', '').replace('```', '').replace('\n', '').replace('True', 'true').replace('False', 'false').strip()
-                        parr_response = json.loads(parr_response)
-
-                        speaker_response["parr_analysis"] = parr_response
+                        speaker_response["parr_analysis"] = _clean_llm_json(parr_future.result())
 
                         llm_responses.append(speaker_response)
-                    except json.JSONDecodeError as e:
+                    except orjson.JSONDecodeError as e:
+                        complete = False
                         continue
 
+            # A speaker whose LLM call failed is missing from the results, so don't pin them
+            if llm_responses and complete:
+                self.champion_cache.put(cache_key, copy.deepcopy(llm_responses))
             return llm_responses
             
         except Exception as e:
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error getting champions for %s", call_title)
             return []
 
     def get_additional_meetings(self, company_name: str, existing_subjects: List[str], date_str: str) -> List[Dict]:
         try:
-            print(f"Getting additional meetings for company {company_name} on date {date_str}.")
+            logger.info("Getting additional meetings for company %s on date %s.", company_name, date_str)
             existing_subjects_set = {subject.lower() for subject in existing_subjects}
 
             added_subjects = set()
@@ -765,6 +1033,8 @@ class GongService:
 
             # Get calls for this date
             calls = self.list_calls(date_str)
+
+            synonym_token_sets = [filter_filler_words(synonym.strip()) for synonym in company_name.split(",")]
             
             for call in calls:
                 call_title = call.get("title", "").lower()
@@ -774,24 +1044,14 @@ class GongService:
                     continue
                     
                 # Use the same matching logic as get_call_id
-                company_name_synonyms = company_name.split(",")
-                
-                # Check if any company name token matches any title word
-                is_match = False
                 title_words = filter_filler_words(call_title)
-                for company_synonym in company_name_synonyms:
-                    synonym_tokens = filter_filler_words(company_synonym.strip())
-                    if synonym_tokens & title_words:
-                        is_match = True
-                        break
-
-                if not is_match:
+                if all(synonym_tokens.isdisjoint(title_words) for synonym_tokens in synonym_token_sets):
                     continue
                     
                 # Skip if this meeting already exists in timeline events or has been added
                 call_title_normalized = call_title.strip()
                 if call_title_normalized in existing_subjects_set or call_title_normalized in added_subjects:
-                    print("Skipping duplicate call title: ", call_title)
+                    logger.debug("Skipping duplicate call title: %s", call_title)
                     continue
                 
                 # Get call ID and transcript
@@ -808,7 +1068,7 @@ class GongService:
                     continue
                     
                 # Combine all non-Galileo transcripts
-                transcript = ""
+                transcript_parts = []
                 for call_transcript in transcript_data["callTranscripts"]:
                     for part in call_transcript.get("transcript", []):
                         speaker_id = part.get("speakerId", "unknown")
@@ -816,9 +1076,9 @@ class GongService:
                         if "galileo.ai" in speaker_id.lower():
                             continue
                         
-                        if "sentences" in part:
-                            for sentence in part["sentences"]:
-                                transcript += sentence.get("text", "") + " "
+                        for sentence in part.get("sentences", []):
+                            transcript_parts.append(sentence.get("text", "") + " ")
+                transcript = "".join(transcript_parts)
                 
                 if not transcript.strip():
                     continue
@@ -859,38 +1119,24 @@ class GongService:
             return additional_meetings
             
         except Exception as e:
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error getting additional meetings for %s on %s", company_name, date_str)
             return []
 
+    def _get_call(self, call_id: str) -> Dict:
+        """Basic metadata (title, scheduled time, ...) for a single call"""
+        call_url = f'https://us-5738.api.gong.io/v2/calls/{call_id}'
+        call_response = self._session.get(call_url, timeout=GONG_HTTP_TIMEOUT)
+        return orjson.loads(call_response.content).get("call", {})
+
     def get_meeting_insights(self, call_id: str) -> Dict:
-        print(f"[Gong] Getting meeting insights for call ID: {call_id}")
-        headers = {'Content-Type': 'application/json'}
+        cached = self.insights_cache.get(str(call_id))
+        if cached is not None:
+            return copy.deepcopy(cached)
 
-        # Step 1: Get transcript
-        transcript_url = 'https://us-5738.api.gong.io/v2/calls/transcript'
-        transcript_payload = {"filter": {"callIds": [str(call_id)]}}
-        transcript_response = requests.post(
-            transcript_url,
-            auth=(self.access_key, self.client_secret),
-            headers=headers,
-            json=transcript_payload
-        )
-        transcript_data = transcript_response.json()
+        logger.info("[Gong] Getting meeting insights for call ID: %s", call_id)
 
-        # Step 2: Extract speakerIds and full transcript
-        speaker_ids = set()
-        buyer_transcripts = ""
-        for transcript in transcript_data.get("callTranscripts", []):
-            for part in transcript.get("transcript", []):
-                speaker_id = part.get("speakerId", "unknown")
-                speaker_ids.add(speaker_id)
-                for sentence in part.get("sentences", []):
-                    buyer_transcripts += sentence.get("text", "") + " "
-
-        print(f"{len(speaker_ids)} speakers detected on the buyer side.")
-        
-        # Step 3: Get speaker info using /v2/calls/extensive
+        # Speaker info and call metadata don't depend on the transcript, so fetch them
+        # in the background while the transcript is fetched and analyzed
         extensive_url = "https://us-5738.api.gong.io/v2/calls/extensive"
         extensive_payload = {
             "filter": {"callIds": [str(call_id)]},
@@ -902,16 +1148,41 @@ class GongService:
             }
         }
 
-        extensive_response = requests.post(
-            extensive_url,
-            auth=(self.access_key, self.client_secret),
-            headers=headers,
-            json=extensive_payload
-        )
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            extensive_future = executor.submit(self._post_json, extensive_url, extensive_payload)
+            call_future = executor.submit(self._get_call, call_id)
+
+            # Step 1: Get transcript
+            transcript_url = 'https://us-5738.api.gong.io/v2/calls/transcript'
+            transcript_payload = {"filter": {"callIds": [str(call_id)]}}
+            transcript_data = self._post_json(transcript_url, transcript_payload) or {}
+
+            # Step 2: Extract speakerIds and full transcript
+            speaker_ids = set()
+            transcript_parts = []
+            for transcript in transcript_data.get("callTranscripts", []):
+                for part in transcript.get("transcript", []):
+                    speaker_id = part.get("speakerId", "unknown")
+                    speaker_ids.add(speaker_id)
+                    for sentence in part.get("sentences", []):
+                        transcript_parts.append(sentence.get("text", "") + " ")
+            buyer_transcripts = "".join(transcript_parts)
+
+            logger.info("%d speakers detected on the buyer side.", len(speaker_ids))
+
+            # Step 3: Run intent detection
+            buyer_intent = self.get_buyer_intent_json(
+                buyer_transcripts,
+                "Galileo",
+            )
+
+            # Step 4: Collect speaker info from /v2/calls/extensive
+            extensive_data = extensive_future.result()
+            call = call_future.result()
 
         buyer_attendees = []
-        if extensive_response.ok:
-            calls_data = extensive_response.json().get("calls", [])
+        if extensive_data is not None:
+            calls_data = extensive_data.get("calls", [])
             for call_data in calls_data:
                 for party in call_data.get("parties", []):
                     email_address = party.get("emailAddress", "")
@@ -932,12 +1203,6 @@ class GongService:
                                 "title": title
                             })
 
-        # Step 5: Run intent detection
-        buyer_intent = self.get_buyer_intent_json(
-            buyer_transcripts,
-            "Galileo",
-        )
-
         champions = [{
             "email": "Not computed",
             "speakerName": "Not computed",
@@ -952,14 +1217,16 @@ class GongService:
             }
         }]
 
-        call_url = f'https://us-5738.api.gong.io/v2/calls/{call_id}'
-        call_response = requests.get(call_url, auth=(self.access_key, self.client_secret))
-        call = call_response.json().get("call", {})
+        # Parse the scheduled time once; it feeds both meeting_date and the cache TTL below
+        try:
+            scheduled = parse_iso_date(call["scheduled"]).date() if call.get("scheduled") else None
+        except (TypeError, ValueError):
+            scheduled = None
 
         insights = {
             "meeting_id": call_id,
             "meeting_title": call.get("title", ""),
-            "meeting_date": call.get("scheduled", "").split("T")[0] if "scheduled" in call else "",
+            "meeting_date": format_iso_date(scheduled) if scheduled else "",
             "buyer_intent": buyer_intent,
             "champion_analysis": champions,
             "topics": "",
@@ -968,4 +1235,11 @@ class GongService:
             "last_updated": datetime.now(timezone.utc).isoformat()
         }
 
+        # Only cache analyzed calls; a call from today may still be processing in Gong,
+        # and a failed buyer-intent request should be retried on the next lookup
+        if buyer_transcripts and buyer_intent.get("intent") != "Error":
+            today = datetime.now(timezone.utc).date()
+            ttl = INSIGHTS_PAST_CALL_TTL if scheduled and scheduled < today else None
+            self.insights_cache.put(str(call_id), copy.deepcopy(insights), ttl=ttl)
+
         return insights
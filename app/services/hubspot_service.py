@@ -1,8 +1,10 @@
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timezone, timedelta
 import sys
 import os
 import json
+import traceback
 
 # Add the project root directory to Python path when running directly
 if __name__ == "__main__":
@@ -38,6 +40,9 @@ class HubspotService:
             # Initialize session for connection reuse
             self._session = requests.Session()
             self._session.headers.update(self.headers)
+            # get_all_deals fans out over up to 20 threads; size the pool to match
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32)
+            self._session.mount("https://", adapter)
 
             from app.services.gong_service import GongService
             self.gong_service = GongService()
@@ -46,6 +51,9 @@ class HubspotService:
             self._deals_cache = None
             self._deals_cache_timestamp = None
             self._deals_cache_ttl = 3600  # 1 hour in seconds
+            # Lowercased stage -> deals, rebuilt whenever the deals cache is refreshed
+            self._deals_by_stage = None
+            self._deals_by_stage_timestamp = None
             
             self._initialized = True
         else:
@@ -61,7 +69,7 @@ class HubspotService:
         try:
             # Get all pipelines
             pipelines_url = "https://api.hubapi.com/crm/v3/pipelines/deals"
-            response = self._session.get(pipelines_url) if hasattr(self, '_session') else requests.get(pipelines_url, headers=self.headers)
+            response = self._session.get(pipelines_url)
             
             if response.status_code != 200:
                 return
@@ -83,7 +91,6 @@ class HubspotService:
                             "closed_lost": stage.get("metadata", {}).get("isClosed", False) and stage.get("metadata", {}).get("probability", 0) == 0,
                         }
         except Exception as e:
-            import traceback
             traceback.print_exc()
 
     def get_stage_id_name_mapping(self):
@@ -91,7 +98,7 @@ class HubspotService:
         if self._stage_mapping is not None:
             return self._stage_mapping
             
-        response = requests.get(settings.PIPELINE_DEALS_URL, headers=self.headers)
+        response = self._session.get(settings.PIPELINE_DEALS_URL)
         stage_map = {}
 
         if response.status_code == 200:
@@ -108,7 +115,7 @@ class HubspotService:
         if self._owner_mapping is not None:
             return self._owner_mapping
             
-        response = requests.get(settings.OWNERS_URL, headers=self.headers)
+        response = self._session.get(settings.OWNERS_URL)
         owner_map = {}
         
         if response.status_code == 200:
@@ -123,7 +130,7 @@ class HubspotService:
 
     def get_pipeline_stages(self) -> List[Dict[str, Any]]:
         """Get all pipeline stages with detailed information"""
-        response = requests.get(settings.PIPELINE_DEALS_URL, headers=self.headers)
+        response = self._session.get(settings.PIPELINE_DEALS_URL)
         
         if response.status_code != 200:
             return []
@@ -169,7 +176,7 @@ class HubspotService:
             if after:
                 params["after"] = after
             
-            response = requests.get(settings.DEALS_URL, headers=self.headers, params=params)
+            response = self._session.get(settings.DEALS_URL, params=params)
             
             if response.status_code == 200:
                 deals = response.json()
@@ -215,7 +222,8 @@ class HubspotService:
         
         # If no deals found, try case-insensitive match
         if not stage_deals:
-            stage_deals = [deal for deal in all_deals if deal['stage'].lower() == stage_name.lower()]
+            target_stage = stage_name.lower()
+            stage_deals = [deal for deal in all_deals if deal['stage'].lower() == target_stage]
         
         # If still no deals, try matching with trimmed whitespace
         if not stage_deals:
@@ -369,7 +377,6 @@ class HubspotService:
                 return result.get("results", [])
             except Exception as e:
                 print(f"[Hubspot] Exception fetching deals page: {str(e)}")
-                import traceback
                 print(f"[Hubspot] Traceback: {traceback.format_exc()}")
                 return []
         
@@ -482,6 +489,17 @@ class HubspotService:
         
         return validated_deals
 
+    def get_deals_in_stage(self, stage_name: str) -> List[Dict[str, Any]]:
+        """Get all cached deals whose stage matches stage_name (case-insensitive)"""
+        all_deals = self.get_all_deals()
+        if self._deals_by_stage is None or self._deals_by_stage_timestamp != self._deals_cache_timestamp:
+            deals_by_stage = {}
+            for deal in all_deals:
+                deals_by_stage.setdefault(deal.get("stage", "").lower(), []).append(deal)
+            self._deals_by_stage = deals_by_stage
+            self._deals_by_stage_timestamp = self._deals_cache_timestamp
+        return self._deals_by_stage.get(stage_name.lower(), [])
+
     def get_deal_timeline(self, deal_name: str, date_range: Optional[tuple[datetime, datetime]] = None) -> Dict[str, Any]:
         """Get the full timeline data for a specific deal. Returns email content if include_content is True
         
@@ -549,8 +567,6 @@ class HubspotService:
             seen_subjects = set()
             prefixes = ["[Gong] Google Meet:", "[Gong] Zoom:", "[Gong] WebEx:", "[Gong]"]
 
-            from colorama import Fore, Style
-
             for eng_id in engagement_ids:
                 try:
                     engagements_url = f"https://api.hubapi.com/crm/v3/objects/engagements/{eng_id}"
@@ -800,7 +816,6 @@ class HubspotService:
             return response
             
         except Exception as e:
-            import traceback
             traceback.print_exc()
             return {"events": [], "start_date": None, "end_date": None, "error": str(e)}
 
@@ -13,11 +13,14 @@ def estimate_token_count(text: str) -> int:
     # Rough approximation: 1 token ≈ 4 characters for English text
     return len(text) // 4
 
-def ask_openai(user_content: str, system_content: str = "You are a smart Sales Analyst.") -> str:
+def ask_openai(user_content: str, system_content: str = "You are a smart Sales Analyst.", json_mode: bool = False) -> str:
     """
     Ask OpenAI a question with system and user content.
     Handles token limit errors by truncating content if necessary.
+    With json_mode, the model is constrained to return a single JSON object
+    (the prompt must mention JSON) and the response is returned unmodified.
     """
+    extra_args = {"response_format": {"type": "json_object"}} if json_mode else {}
     try:
         # Estimate total tokens
         total_tokens = estimate_token_count(system_content + user_content)
@@ -40,8 +43,11 @@ def ask_openai(user_content: str, system_content: str = "You are a smart Sales A
             messages=[
                 {"role": "system", "content": system_content},
                 {"role": "user", "content": user_content}
-            ]
+            ],
+            **extra_args
         )
+        if json_mode:
+            return response.choices[0].message.content.strip()
         output = response.choices[0].message.content.replace("```json", "").replace("```", "").replace('\n', ' ').replace("json", "")
         return output.strip()
 
@@ -56,7 +62,8 @@ def ask_openai(user_content: str, system_content: str = "You are a smart Sales A
                     messages=[
                         {"role": "system", "content": system_content},
                         {"role": "user", "content": user_content}
-                    ]
+                    ],
+                    **extra_args
                 )
                 return response.choices[0].message.content
             except Exception as e2:
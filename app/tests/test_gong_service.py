@@ -1,13 +1,21 @@
+import json
 import pytest
 from unittest.mock import patch, MagicMock
 from datetime import datetime
-from app.services.gong_service import GongService
+from app.services.gong_service import GongService, LRUCache, _parse_json_response
 
 class TestGongService:
     @pytest.fixture
     def gong_service(self):
         """Create a GongService instance for testing"""
-        return GongService()
+        service = GongService()
+        # Fresh caches so mocked responses don't leak between tests
+        service.http_cache = LRUCache(capacity=512, ttl=300)
+        service.llm_cache = LRUCache(capacity=2048, ttl=86400)
+        service.champion_cache = LRUCache(capacity=1000, ttl=3600)
+        service.concerns_cache = LRUCache(capacity=1000, ttl=3600)
+        service.insights_cache = LRUCache(capacity=512, ttl=300)
+        return service
 
     @pytest.fixture
     def mock_calls_response(self):
@@ -48,13 +56,26 @@ class TestGongService:
 
     def test_list_calls(self, gong_service, mock_calls_response):
         """Test list_calls function"""
-        with patch('requests.get') as mock_get:
-            # Configure mock
+        extensive_response = {
+            "calls": [{
+                "parties": [
+                    {"name": "Jane Buyer", "emailAddress": "jane@pandadoc.com", "affiliation": "External"}
+                ]
+            }]
+        }
+        with patch.object(gong_service._session, 'get') as mock_get, \
+             patch.object(gong_service._session, 'post') as mock_post:
+            # Configure mocks
             mock_response = MagicMock()
             mock_response.ok = True
-            mock_response.json.return_value = mock_calls_response
+            mock_response.content = json.dumps(mock_calls_response).encode()
             mock_get.return_value = mock_response
 
+            mock_extensive = MagicMock()
+            mock_extensive.ok = True
+            mock_extensive.content = json.dumps(extensive_response).encode()
+            mock_post.return_value = mock_extensive
+
             # Call the function
             result = gong_service.list_calls("2024-04-17")
 
@@ -62,7 +83,12 @@ class TestGongService:
             assert len(result) == 2
             assert result[0]["id"] == "123"
             assert result[1]["id"] == "456"
+            assert result[0]["attendees"] == [
+                {"name": "Jane Buyer", "email": "jane@pandadoc.com", "affiliation": "External"}
+            ]
             mock_get.assert_called_once()
+            # One extensive lookup per call for its attendees
+            assert mock_post.call_count == 2
 
     def test_find_call_id_by_title(self, gong_service):
         """Test find_call_id_by_title function"""
@@ -85,11 +111,11 @@ class TestGongService:
 
     def test_get_call_transcripts(self, gong_service, mock_transcript_response):
         """Test get_call_transcripts function"""
-        with patch('requests.post') as mock_post:
+        with patch.object(gong_service._session, 'post') as mock_post:
             # Configure mock
             mock_response = MagicMock()
             mock_response.ok = True
-            mock_response.json.return_value = mock_transcript_response
+            mock_response.content = json.dumps(mock_transcript_response).encode()
             mock_post.return_value = mock_response
 
             # Call the function
@@ -174,7 +200,7 @@ class TestGongService:
 
     def test_error_handling(self, gong_service):
         """Test error handling in various functions"""
-        with patch('requests.get') as mock_get:
+        with patch.object(gong_service._session, 'get') as mock_get:
             # Configure mock to simulate API error
             mock_response = MagicMock()
             mock_response.ok = False
@@ -186,7 +212,7 @@ class TestGongService:
             result = gong_service.list_calls("2024-04-17")
             assert result == []
 
-        with patch('requests.post') as mock_post:
+        with patch.object(gong_service._session, 'post') as mock_post:
             # Configure mock to simulate API error
             mock_response = MagicMock()
             mock_response.ok = False
@@ -200,4 +226,42 @@ class TestGongService:
                 "2024-04-17T00:00:00Z",
                 "2024-04-17T23:59:59Z"
             )
-            assert result is None 
\ No newline at end of file
+            assert result is None 
+
+    def test_parse_json_response_extracts_wrapped_json(self):
+        """Test JSON answers wrapped in prose or code fences are still parsed"""
+        assert _parse_json_response('{"intent": "Neutral"}') == {"intent": "Neutral"}
+
+        wrapped = 'Here you go:\n```json\n{"intent": "Neutral", "summary": "uses {braces} and \\"quotes\\""}\n```'
+        assert _parse_json_response(wrapped) == {"intent": "Neutral", "summary": 'uses {braces} and "quotes"'}
+
+        with pytest.raises(ValueError):
+            _parse_json_response("## Not JSON at all")
+
+    @patch('app.services.gong_service.ask_openai')
+    def test_cached_ask_does_not_cache_errors(self, mock_ask_openai, gong_service):
+        """Test LLM error responses are retried instead of served from the cache"""
+        mock_ask_openai.side_effect = ["Error: Failed to get response from OpenAI: 429", '{"ok": true}']
+
+        assert gong_service._cached_ask("test", user_content="prompt").startswith("Error:")
+        assert gong_service._cached_ask("test", user_content="prompt") == '{"ok": true}'
+        assert gong_service._cached_ask("test", user_content="prompt") == '{"ok": true}'
+        assert mock_ask_openai.call_count == 2
+
+    @patch('app.services.gong_service.filter_filler_words', side_effect=lambda text: set(text.lower().split()))
+    @patch('app.services.gong_service.extract_company_name', return_value="Pandadoc")
+    def test_get_buyer_intent_partitions_calls_by_utc_day(self, mock_extract, mock_filter, gong_service):
+        """Test calls are bucketed by their UTC start date, with a fallback for undated calls"""
+        calls = [
+            # 2024-04-17 16:30 local is 2024-04-18 00:30 UTC
+            {"id": "late", "title": "Late call", "started": "2024-04-17T16:30:00-08:00"},
+            {"id": "undated", "title": "Undated call"},
+        ]
+        with patch.object(gong_service, 'list_calls_between', return_value=calls), \
+             patch.object(gong_service, 'get_transcript_and_topics', return_value=("hello", [])) as mock_transcript, \
+             patch.object(gong_service, 'get_buyer_intent_json', return_value={"intent": "Neutral"}):
+            assert gong_service.get_buyer_intent("Late call", "2024-04-17", "Galileo") == {"intent": "Neutral"}
+            mock_transcript.assert_called_with("late", "2024-04-18T00:00:00Z", "2024-04-18T23:59:59Z")
+
+            assert gong_service.get_buyer_intent("Undated call", "2024-04-17", "Galileo") == {"intent": "Neutral"}
+            mock_transcript.assert_called_with("undated", "2024-04-17T00:00:00Z", "2024-04-17T23:59:59Z")
@@ -1,11 +1,46 @@
+import hashlib
+import orjson
+from datetime import datetime, timedelta
+from typing import List
+from functools import lru_cache
 from app.services.llm_service import ask_openai
 from app.utils.prompts import company_name_prompt
 from colorama import Fore, Style
 
 def extract_company_name(call_title_or_deal_name):
     """Extract company name from call title"""
+    try:
+        return _extract_company_name_cached(call_title_or_deal_name)
+    except ValueError as e:
+        # LLM errors are returned as-is but never cached
+        return str(e)
+
+@lru_cache(maxsize=4096)
+def _extract_company_name_cached(call_title_or_deal_name):
     response = ask_openai(
         user_content=company_name_prompt.format(call_title=call_title_or_deal_name),
         system_content="You are a smart Sales Operations Analyst that analyzes Sales calls."
     )
-    return response.strip() 
+    response = response.strip()
+    if response.startswith("Error:"):
+        raise ValueError(response)
+    return response
+
+@lru_cache(maxsize=4096)
+def parse_iso_date(date_str: str) -> datetime:
+    """Parse an ISO-8601 date string (HubSpot/Gong format, 'Z' suffix allowed).
+    Raises ValueError/TypeError if the string cannot be parsed."""
+    return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+
+def format_iso_date(d) -> str:
+    """Format a date/datetime as YYYY-MM-DD (same as strftime("%Y-%m-%d"), without the locale-aware call)"""
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d}"
+
+def date_range_strs(start: datetime, end: datetime) -> List[str]:
+    """Return every day between start and end (inclusive) as a YYYY-MM-DD string"""
+    return [format_iso_date(start + timedelta(days=i)) for i in range((end - start).days + 1)]
+
+def content_hash(data, digest_size: int = 16) -> str:
+    """Stable hex digest of a JSON-serializable value, used to detect unchanged documents"""
+    payload = orjson.dumps(data, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return hashlib.blake2b(payload, digest_size=digest_size).hexdigest()
@@ -4,6 +4,11 @@ from app.api import hubspot, hubspot_mongo, api_hubspot_stage_insights
 from app.middleware.session_middleware import SessionMiddleware
 from app.middleware.response_middleware import ResponseMiddleware
 from app.middleware.performance_middleware import PerformanceMiddleware
+from app.core.logging_config import configure_logging
+from app.services.dss2 import wait_for_background_tasks
+from app.services.gong_service import close_shared_session
+
+configure_logging()
 
 app = FastAPI(title="HubSpot CRM API")
 
@@ -38,6 +43,15 @@ app.include_router(hubspot.router, prefix="/api/hubspot", tags=["hubspot"])
 app.include_router(hubspot_mongo.router, prefix="/api/hubspot/v2", tags=["hubspot-v2"])
 app.include_router(api_hubspot_stage_insights.router, prefix="/api/hubspot/stage-insights", tags=["stage-insights"])
 
+# Heroku sends SIGKILL 30s after SIGTERM; stop waiting a few seconds before that
+SHUTDOWN_WAIT_SECONDS = 25
+
+@app.on_event("shutdown")
+def wait_for_background_syncs():
+    # Give queued owner-performance syncs a chance to finish before the process exits
+    wait_for_background_tasks(timeout=SHUTDOWN_WAIT_SECONDS)
+    close_shared_session()
+
 if __name__ == "__main__":
     import uvicorn
     import os